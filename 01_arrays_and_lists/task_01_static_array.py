@@ -4,7 +4,151 @@
 Оценим трудоемкость каждой операции.
 """
 
-class StaticArray:
+import array
+import bisect
+import itertools
+import mmap
+import os
+import random
+import struct
+import sys
+import tempfile
+import time
+from abc import ABC, abstractmethod
+
+
+class ArrayView:
+    """Представление (view) части массива без копирования элементов.
+
+    Хранит только ссылку на родителя и диапазон индексов range,
+    поэтому вложенный срез - это тоже O(1). Запись идет через
+    parent.set, чтобы индексы родителя оставались актуальными.
+    Если родитель сменил хранилище (расширение или сжатие
+    DynamicArray) или стал короче диапазона, представление считается
+    устаревшим и любое обращение вызывает RuntimeError.
+    """
+
+    def __init__(self, parent, indices: range):
+        """Создание представления.
+
+        Args:
+            parent: Массив с атрибутами data и size
+            indices: Индексы родителя, которые видит представление
+        """
+        self.parent = parent
+        self.indices = indices
+        self._data = parent.data
+
+    def _check(self):
+        """Проверка актуальности; возвращает хранилище родителя."""
+        if self.parent.data is not self._data:
+            raise RuntimeError("Представление устарело: родительский массив перевыделил память")
+        if self.indices and max(self.indices[0], self.indices[-1]) >= self.parent.size:
+            raise RuntimeError("Представление устарело: родительский массив стал короче")
+        return self._data
+
+    def __len__(self) -> int:
+        return len(self.indices)
+
+    def __getitem__(self, key):
+        """Элемент по индексу или вложенное представление по срезу. Сложность: O(1)"""
+        if isinstance(key, slice):
+            self._check()
+            return ArrayView(self.parent, self.indices[key])
+        return self._check()[self.indices[key]]
+
+    def __setitem__(self, key: int, value) -> None:
+        """Запись элемента в родительский массив. Сложность: O(1) + обновление индексов"""
+        self._check()
+        self.parent.set(self.indices[key], value)
+
+    def __iter__(self):
+        data = self._check()
+        if self.indices.step == 1:
+            return itertools.islice(data, self.indices.start, self.indices.stop)
+        return (data[i] for i in self.indices)
+
+    def find(self, value) -> int:
+        """Поиск элемента в представлении. Сложность: O(k)
+
+        Returns:
+            Индекс внутри представления или -1 если не найден.
+        """
+        data = self._check()
+        if self.indices.step == 1 and hasattr(data, "index"):
+            try:
+                return data.index(value, self.indices.start, self.indices.stop) - self.indices.start
+            except ValueError:
+                return -1
+        for position, i in enumerate(self.indices):
+            if data[i] == value:
+                return position
+        return -1
+
+    def tolist(self) -> list:
+        """Явная копия элементов представления."""
+        return list(self)
+
+    def __str__(self) -> str:
+        """Строковое представление."""
+        return f"[{', '.join(str(v) for v in self)}]"
+
+
+class IndexedStorageMixin:
+    """Общие операции массивов с хранилищем data и размером size.
+
+    Замена элемента, представления (view) и подключение индексов
+    диапазонных запросов, которые получают уведомления об изменениях.
+    """
+
+    _indexes = ()  # Подключенные индексы диапазонных запросов
+
+    def set(self, index: int, value) -> None:
+        """Замена элемента по индексу. Сложность: O(1) + обновление индексов"""
+        if index < 0 or index >= self.size:
+            raise IndexError(f"Индекс {index} вне диапазона [0, {self.size-1}]")
+        self.data[index] = value
+        if self._indexes:
+            self._notify_point(index)
+
+    def attach_index(self, index) -> None:
+        """Подключение индекса, который будет получать уведомления об изменениях."""
+        if not self._indexes:
+            self._indexes = []
+        self._indexes.append(index)
+
+    def detach_index(self, index) -> None:
+        """Отключение индекса."""
+        if index not in self._indexes:
+            raise ValueError("Индекс не подключен к этому массиву")
+        self._indexes.remove(index)
+
+    def _notify_point(self, index: int) -> None:
+        """Уведомление индексов: изменилась одна ячейка."""
+        for range_index in self._indexes:
+            range_index._on_point(index)
+
+    def _notify_shift(self, start: int) -> None:
+        """Уведомление индексов: сдвинулись все ячейки начиная со start."""
+        for range_index in self._indexes:
+            range_index._on_shift(start)
+
+    def view(self, start: int = 0, stop: int = None) -> ArrayView:
+        """Представление диапазона [start, stop) без копирования.
+
+        Если массив перевыделит хранилище, представление устаревает.
+        Сложность: O(1)
+        """
+        if stop is None:
+            stop = self.size
+        if start < 0 or stop > self.size or start > stop:
+            raise IndexError(f"Диапазон [{start}, {stop}) вне диапазона [0, {self.size}]")
+        return ArrayView(self, range(start, stop))
+
+
+class StaticArray(IndexedStorageMixin):
+    _empty = None  # Значение для очистки освободившихся ячеек
+    
     def __init__(self, capacity: int):
         """Инициализация статического массива с заданной емкостью.
         
@@ -24,6 +168,8 @@ class StaticArray:
             raise Exception(f"Массив переполнен! Емкость: {self.capacity}")
         self.data[self.size] = value
         self.size += 1
+        if self._indexes:
+            self._notify_point(self.size - 1)
     
     def pushFront(self, value) -> None:
         """Добавление элемента в начало массива.
@@ -39,6 +185,8 @@ class StaticArray:
         
         self.data[0] = value
         self.size += 1
+        if self._indexes:
+            self._notify_shift(0)
     
     def insert(self, index: int, value) -> None:
         """Вставка элемента по указанному индексу.
@@ -56,6 +204,8 @@ class StaticArray:
         
         self.data[index] = value
         self.size += 1
+        if self._indexes:
+            self._notify_shift(index)
     
     def remove(self, index: int) -> None:
         """Удаление элемента по указанному индексу.
@@ -71,6 +221,8 @@ class StaticArray:
         
         self.size -= 1
         self.data[self.size] = None  # Очищаем последний элемент
+        if self._indexes:
+            self._notify_shift(index)
     
     def find(self, value) -> int:
         """Поиск элемента по значению.
@@ -85,6 +237,55 @@ class StaticArray:
                 return i
         return -1
     
+    def find_all(self, value) -> list:
+        """Поиск всех позиций элемента. Сложность: O(n)"""
+        return [i for i in range(self.size) if self.data[i] == value]
+    
+    def count(self, value) -> int:
+        """Количество вхождений элемента. Сложность: O(n)"""
+        return len(self.find_all(value))
+    
+    def _pack(self, values) -> list:
+        """Упаковка значений в контейнер того же типа, что и хранилище."""
+        return list(values)
+    
+    def insert_many(self, index: int, iterable) -> None:
+        """Вставка нескольких элементов, начиная с указанного индекса.
+        
+        Сложность: O(n + k) - хвост сдвигается один раз на k позиций.
+        """
+        values = self._pack(iterable)
+        count = len(values)
+        if self.size + count > self.capacity:
+            raise Exception(f"Массив переполнен! Емкость: {self.capacity}")
+        if index < 0 or index > self.size:
+            raise IndexError(f"Индекс {index} вне диапазона [0, {self.size}]")
+        
+        self.data[index + count:self.size + count] = self.data[index:self.size]
+        self.data[index:index + count] = values
+        self.size += count
+        if self._indexes:
+            self._notify_shift(index)
+    
+    def extend(self, iterable) -> None:
+        """Добавление нескольких элементов в конец. Сложность: O(k)"""
+        self.insert_many(self.size, iterable)
+    
+    def remove_range(self, start: int, stop: int) -> None:
+        """Удаление элементов с индексами [start, stop).
+        
+        Сложность: O(n) - хвост сдвигается влево один раз.
+        """
+        if start < 0 or stop > self.size or start > stop:
+            raise IndexError(f"Диапазон [{start}, {stop}) вне диапазона [0, {self.size}]")
+        
+        count = stop - start
+        self.data[start:self.size - count] = self.data[stop:self.size]
+        self.size -= count
+        self.data[self.size:self.size + count] = self._pack([self._empty] * count)
+        if self._indexes:
+            self._notify_shift(start)
+    
     def __str__(self) -> str:
         """Строковое представление массива."""
         return f"[{', '.join(str(self.data[i]) for i in range(self.size))}]"
@@ -96,6 +297,907 @@ class StaticArray:
     def get_size(self) -> int:
         """Возвращает текущий размер массива."""
         return self.size
+    
+    def get(self, index: int):
+        """Получение элемента по индексу. Сложность: O(1)"""
+        if index < 0 or index >= self.size:
+            raise IndexError(f"Индекс {index} вне диапазона [0, {self.size-1}]")
+        return self.data[index]
+
+
+class RangeIndex(ABC):
+    """Базовый класс индекса диапазонных запросов над массивом.
+
+    Индекс подключается к массиву (attach_index) и получает уведомления:
+    об изменении одной ячейки (_on_point) и о сдвиге хвоста (_on_shift).
+    Точечное изменение обновляет индекс сразу, после сдвига индекс
+    перестраивается при следующем запросе.
+    """
+
+    identity = None  # Значение для ячеек за пределами size
+
+    def __init__(self, parent):
+        """Создание индекса и подключение к массиву.
+
+        Args:
+            parent: StaticArray или DynamicArray
+        """
+        self.parent = parent
+        self._stale = True
+        parent.attach_index(self)
+
+    def detach(self) -> None:
+        """Отключение индекса от массива."""
+        self.parent.detach_index(self)
+
+    def _value(self, index: int):
+        """Значение ячейки для индекса (identity за пределами size)."""
+        if index < self.parent.size:
+            return self.parent.data[index]
+        return self.identity
+
+    def _ensure(self) -> None:
+        if self._stale:
+            self._build()
+            self._stale = False
+
+    def _check_range(self, start: int, stop: int) -> None:
+        if start < 0 or stop > self.parent.size or start > stop:
+            raise IndexError(f"Диапазон [{start}, {stop}) вне диапазона [0, {self.parent.size}]")
+
+    def _on_shift(self, start: int) -> None:
+        self._stale = True
+
+    def _on_point(self, index: int) -> None:
+        self._stale = True
+
+    @abstractmethod
+    def _build(self) -> None:
+        """Полная перестройка индекса по текущему содержимому массива."""
+
+
+class FenwickIndex(RangeIndex):
+    """Дерево Фенвика для сумм на отрезке.
+
+    Строится по всей емкости массива, поэтому pushBack и set
+    обновляют его за O(log n), а запрос суммы тоже стоит O(log n).
+    """
+
+    identity = 0
+
+    def _build(self) -> None:
+        """Построение за O(n)."""
+        n = self.parent.capacity
+        self._values = [self._value(i) for i in range(n)]
+        tree = [0] + self._values
+        for i in range(1, n + 1):
+            parent = i + (i & -i)
+            if parent <= n:
+                tree[parent] += tree[i]
+        self._tree = tree
+
+    def _on_point(self, index: int) -> None:
+        if self._stale:
+            return
+        if index >= len(self._values):
+            self._stale = True
+            return
+        new_value = self._value(index)
+        delta = new_value - self._values[index]
+        self._values[index] = new_value
+        i = index + 1
+        while i < len(self._tree):
+            self._tree[i] += delta
+            i += i & -i
+
+    def prefix_sum(self, stop: int):
+        """Сумма элементов [0, stop). Сложность: O(log n)"""
+        self._check_range(0, stop)
+        self._ensure()
+        total = 0
+        while stop > 0:
+            total += self._tree[stop]
+            stop -= stop & -stop
+        return total
+
+    def range_sum(self, start: int, stop: int):
+        """Сумма элементов [start, stop). Сложность: O(log n)"""
+        self._check_range(start, stop)
+        return self.prefix_sum(stop) - self.prefix_sum(start)
+
+
+class SegmentTreeIndex(RangeIndex):
+    """Дерево отрезков для любой ассоциативной операции (min, max, gcd, ...).
+
+    Операция не обязана быть коммутативной: левая и правая части
+    запроса накапливаются отдельно.
+    """
+
+    def __init__(self, parent, op=min, identity=float("inf")):
+        """Создание дерева отрезков.
+
+        Args:
+            parent: StaticArray или DynamicArray
+            op: Ассоциативная функция двух аргументов
+            identity: Нейтральный элемент операции
+        """
+        self.op = op
+        self.identity = identity
+        super().__init__(parent)
+
+    def _build(self) -> None:
+        """Построение за O(n)."""
+        n = self.parent.capacity
+        tree = [self.identity] * n + [self._value(i) for i in range(n)]
+        for i in range(n - 1, 0, -1):
+            tree[i] = self.op(tree[2 * i], tree[2 * i + 1])
+        self._n = n
+        self._tree = tree
+
+    def _on_point(self, index: int) -> None:
+        if self._stale:
+            return
+        if index >= self._n:
+            self._stale = True
+            return
+        i = index + self._n
+        self._tree[i] = self._value(index)
+        while i > 1:
+            i >>= 1
+            self._tree[i] = self.op(self._tree[2 * i], self._tree[2 * i + 1])
+
+    def query(self, start: int, stop: int):
+        """Результат операции на [start, stop) (identity для пустого). Сложность: O(log n)"""
+        self._check_range(start, stop)
+        self._ensure()
+        left_result = self.identity
+        right_result = self.identity
+        left = start + self._n
+        right = stop + self._n
+        while left < right:
+            if left & 1:
+                left_result = self.op(left_result, self._tree[left])
+                left += 1
+            if right & 1:
+                right -= 1
+                right_result = self.op(self._tree[right], right_result)
+            left >>= 1
+            right >>= 1
+        return self.op(left_result, right_result)
+
+
+class SparseTableIndex(RangeIndex):
+    """Разреженная таблица для статических запросов min/max за O(1).
+
+    Подходит для идемпотентных операций (min, max, gcd). Любое
+    изменение массива помечает таблицу устаревшей, и она
+    перестраивается за O(n log n) при следующем запросе.
+    """
+
+    def __init__(self, parent, op=min):
+        """Создание разреженной таблицы.
+
+        Args:
+            parent: StaticArray или DynamicArray
+            op: Идемпотентная ассоциативная функция
+        """
+        self.op = op
+        super().__init__(parent)
+
+    def _build(self) -> None:
+        """Построение за O(n log n)."""
+        n = self.parent.size
+        levels = [[self.parent.data[i] for i in range(n)]]
+        width = 1
+        while 2 * width <= n:
+            previous = levels[-1]
+            levels.append([self.op(previous[i], previous[i + width])
+                           for i in range(n - 2 * width + 1)])
+            width *= 2
+        self._levels = levels
+
+    def query(self, start: int, stop: int):
+        """Результат операции на непустом [start, stop). Сложность: O(1)"""
+        self._check_range(start, stop)
+        if start == stop:
+            raise ValueError("Пустой диапазон")
+        self._ensure()
+        level = (stop - start).bit_length() - 1
+        row = self._levels[level]
+        return self.op(row[start], row[stop - (1 << level)])
+
+
+class IndexedStaticArray(StaticArray):
+    """Статический массив с хэш-индексом "значение -> позиции".
+
+    Операции в конце массива (pushBack, remove последнего, extend)
+    обновляют индекс сразу. Сдвиги лишь отмечают, с какой позиции
+    индекс устарел; перестройка откладывается до следующего поиска.
+    Если индекс не нужен (много сдвигов и мало поисков), его можно
+    отключить: indexed=False или disable_index().
+    Значения должны быть хэшируемыми.
+    """
+
+    def __init__(self, capacity: int, indexed: bool = True):
+        """Инициализация массива с индексом.
+
+        Args:
+            capacity: Максимальное количество элементов
+            indexed: Поддерживать ли индекс
+        """
+        super().__init__(capacity)
+        self.indexed = indexed
+        self._positions = {}  # значение -> возрастающий список позиций
+        self._stale_from = 0  # None - индекс актуален, иначе позиции >= _stale_from устарели
+
+    def _invalidate(self, index: int) -> None:
+        """Отметка, что позиции начиная с index в индексе устарели."""
+        if self._stale_from is None or index < self._stale_from:
+            self._stale_from = index
+
+    def _index_append(self, start: int, values) -> None:
+        """Добавление в индекс значений, записанных в конец массива."""
+        if self._stale_from is not None:
+            return
+        for offset, value in enumerate(values):
+            self._positions.setdefault(value, []).append(start + offset)
+
+    def _index_remove_tail(self, start: int, values) -> None:
+        """Удаление из индекса значений, стертых с конца массива."""
+        if self._stale_from is not None:
+            self._invalidate(start)
+            return
+        for value in values:
+            positions = self._positions[value]
+            positions.pop()
+            if not positions:
+                del self._positions[value]
+
+    def _ensure_index(self) -> None:
+        """Перестройка индекса, если он устарел. Сложность: O(n)"""
+        if self._stale_from is None:
+            return
+        self._positions = {}
+        for i in range(self.size):
+            self._positions.setdefault(self.data[i], []).append(i)
+        self._stale_from = None
+
+    def enable_index(self) -> None:
+        """Включение индекса (строится при первом поиске)."""
+        self.indexed = True
+
+    def disable_index(self) -> None:
+        """Отключение индекса: мутаторы больше не тратят время на него."""
+        self.indexed = False
+        self._positions = {}
+        self._stale_from = 0
+
+    def pushBack(self, value) -> None:
+        """Добавление в конец. Сложность: O(1)"""
+        super().pushBack(value)
+        if self.indexed:
+            self._index_append(self.size - 1, [value])
+
+    def pushFront(self, value) -> None:
+        """Добавление в начало. Сложность: O(n), индекс помечается устаревшим."""
+        super().pushFront(value)
+        self._invalidate(0)
+
+    def insert(self, index: int, value) -> None:
+        """Вставка по индексу. Сложность: O(n)"""
+        at_end = index == self.size
+        super().insert(index, value)
+        if at_end and self.indexed:
+            self._index_append(index, [value])
+        else:
+            self._invalidate(index)
+
+    def set(self, index: int, value) -> None:
+        """Замена элемента по индексу. Сложность: O(1) в среднем + O(k) по позициям значения"""
+        old_value = self.data[index] if 0 <= index < self.size else None
+        super().set(index, value)
+        if not self.indexed or self._stale_from is not None:
+            self._invalidate(index)
+            return
+        positions = self._positions[old_value]
+        positions.remove(index)
+        if not positions:
+            del self._positions[old_value]
+        bisect.insort(self._positions.setdefault(value, []), index)
+
+    def remove(self, index: int) -> None:
+        """Удаление по индексу. Сложность: O(n)"""
+        at_end = index == self.size - 1
+        value = self.data[index] if 0 <= index < self.size else None
+        super().remove(index)
+        if at_end and self.indexed:
+            self._index_remove_tail(index, [value])
+        else:
+            self._invalidate(index)
+
+    def insert_many(self, index: int, iterable) -> None:
+        """Пакетная вставка. Сложность: O(n + k)"""
+        values = self._pack(iterable)
+        at_end = index == self.size
+        super().insert_many(index, values)
+        if at_end and self.indexed:
+            self._index_append(index, values)
+        else:
+            self._invalidate(index)
+
+    def remove_range(self, start: int, stop: int) -> None:
+        """Удаление диапазона [start, stop). Сложность: O(n)"""
+        at_end = stop == self.size
+        values = self.data[start:stop]
+        super().remove_range(start, stop)
+        if at_end and self.indexed:
+            self._index_remove_tail(start, reversed(values))
+        else:
+            self._invalidate(start)
+
+    def find(self, value) -> int:
+        """Поиск первого вхождения. Сложность: O(1) в среднем."""
+        if not self.indexed:
+            return super().find(value)
+        positions = self._positions.get(value)
+        # Позиции левее устаревшей границы остаются верными
+        if positions and (self._stale_from is None or positions[0] < self._stale_from):
+            return positions[0]
+        if self._stale_from is None:
+            return -1
+        self._ensure_index()
+        positions = self._positions.get(value)
+        return positions[0] if positions else -1
+
+    def find_all(self, value) -> list:
+        """Все позиции элемента. Сложность: O(1) в среднем + размер ответа."""
+        if not self.indexed:
+            return super().find_all(value)
+        self._ensure_index()
+        return list(self._positions.get(value, ()))
+
+    def count(self, value) -> int:
+        """Количество вхождений элемента. Сложность: O(1) в среднем."""
+        if not self.indexed:
+            return super().count(value)
+        self._ensure_index()
+        return len(self._positions.get(value, ()))
+
+
+class TypedStaticArray(StaticArray):
+    """Статический массив с типизированным хранилищем на array.array.
+
+    Элементы хранятся подряд в одном буфере фиксированного типа
+    (например, 'q' - int64, 'd' - float64), без отдельного объекта
+    Python на каждый элемент. Сдвиги выполняются одним срезом.
+    """
+
+    _empty = 0
+
+    def __init__(self, capacity: int, typecode: str = 'q'):
+        """Инициализация типизированного массива.
+
+        Args:
+            capacity: Максимальное количество элементов
+            typecode: Код типа элементов модуля array ('q', 'd', 'i', ...)
+        """
+        self.capacity = capacity
+        self.size = 0
+        self.typecode = typecode
+        self.data = array.array(typecode, bytes(array.array(typecode).itemsize * capacity))
+
+    def pushFront(self, value) -> None:
+        """Добавление элемента в начало массива.
+
+        Сложность: O(n), но сдвиг выполняется одной операцией над буфером.
+        """
+        if self.size >= self.capacity:
+            raise Exception(f"Массив переполнен! Емкость: {self.capacity}")
+
+        self.data[1:self.size + 1] = self.data[0:self.size]
+        self.data[0] = value
+        self.size += 1
+        if self._indexes:
+            self._notify_shift(0)
+
+    def insert(self, index: int, value) -> None:
+        """Вставка элемента по указанному индексу.
+
+        Сложность: O(n) - сдвиг хвоста одним срезом.
+        """
+        if self.size >= self.capacity:
+            raise Exception(f"Массив переполнен! Емкость: {self.capacity}")
+        if index < 0 or index > self.size:
+            raise IndexError(f"Индекс {index} вне диапазона [0, {self.size}]")
+
+        self.data[index + 1:self.size + 1] = self.data[index:self.size]
+        self.data[index] = value
+        self.size += 1
+        if self._indexes:
+            self._notify_shift(index)
+
+    def remove(self, index: int) -> None:
+        """Удаление элемента по указанному индексу.
+
+        Сложность: O(n) - сдвиг хвоста влево одним срезом.
+        """
+        if index < 0 or index >= self.size:
+            raise IndexError(f"Индекс {index} вне диапазона [0, {self.size-1}]")
+
+        self.data[index:self.size - 1] = self.data[index + 1:self.size]
+        self.size -= 1
+        self.data[self.size] = self._empty  # Очищаем последний элемент
+        if self._indexes:
+            self._notify_shift(index)
+
+    def find(self, value) -> int:
+        """Поиск элемента по значению.
+
+        Сложность: O(n), но сравнение выполняется внутри array.index.
+        """
+        try:
+            return self.data.index(value, 0, self.size)
+        except (ValueError, TypeError):
+            return -1
+
+    def _pack(self, values) -> array.array:
+        """Упаковка значений в array.array с типом хранилища."""
+        return array.array(self.typecode, values)
+
+    def get_itemsize(self) -> int:
+        """Возвращает размер одного элемента в байтах."""
+        return self.data.itemsize
+
+
+class MappedStaticArray(TypedStaticArray):
+    """Типизированный статический массив, хранящийся в файле через mmap.
+
+    Файл состоит из заголовка (сигнатура, код типа, емкость, размер)
+    и области записей фиксированной ширины. Открытие существующего файла
+    не копирует данные: массив работает прямо поверх отображения,
+    поэтому несколько процессов могут читать один файл совместно.
+    Изменения записываются на диск явным вызовом flush().
+    """
+
+    MAGIC = b"SARR"
+    HEADER = struct.Struct("<4scxxxQQ")  # сигнатура, typecode, емкость, размер
+
+    def __init__(self, path: str, capacity: int = None, typecode: str = 'q',
+                 readonly: bool = False):
+        """Создание нового файла или открытие существующего.
+
+        Args:
+            path: Путь к файлу массива
+            capacity: Емкость нового массива; None - открыть существующий файл
+            typecode: Код типа элементов (только при создании)
+            readonly: Открыть только для чтения (только для существующего файла)
+        """
+        self.path = path
+        self.readonly = readonly
+        if capacity is not None:
+            itemsize = array.array(typecode).itemsize
+            with open(path, "wb") as f:
+                f.write(self.HEADER.pack(self.MAGIC, typecode.encode(), capacity, 0))
+                f.truncate(self.HEADER.size + itemsize * capacity)
+
+        self._file = open(path, "rb" if readonly else "r+b")
+        access = mmap.ACCESS_READ if readonly else mmap.ACCESS_WRITE
+        self._mmap = mmap.mmap(self._file.fileno(), 0, access=access)
+
+        magic, code, self.capacity, self.size = self.HEADER.unpack_from(self._mmap, 0)
+        if magic != self.MAGIC:
+            self.close()
+            raise ValueError(f"Файл {path} не является файлом MappedStaticArray")
+        self.typecode = code.decode()
+        self._view = memoryview(self._mmap)
+        self.data = self._view[self.HEADER.size:].cast(self.typecode)
+
+    def find(self, value) -> int:
+        """Поиск элемента по значению. Сложность: O(n)"""
+        data = self.data
+        for i in range(self.size):
+            if data[i] == value:
+                return i
+        return -1
+
+    def flush(self) -> None:
+        """Запись размера в заголовок и сброс изменений на диск."""
+        if self.readonly:
+            return
+        self.HEADER.pack_into(self._mmap, 0, self.MAGIC, self.typecode.encode(),
+                              self.capacity, self.size)
+        self._mmap.flush()
+
+    def close(self) -> None:
+        """Сохранение изменений и закрытие отображения."""
+        if self._mmap.closed:
+            return
+        if hasattr(self, "data"):
+            self.flush()
+            # Все представления буфера нужно освободить до закрытия mmap
+            self.data.release()
+            self._view.release()
+        self._mmap.close()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+class SortedStaticArray(StaticArray):
+    """Статический массив, в котором элементы всегда упорядочены.
+
+    Поиск выполняется двоичным поиском (модуль bisect) за O(log n).
+    Позиционные операции разрешены, только если не нарушают порядок.
+    """
+
+    def _check_order(self, index: int, value, replace: bool = False) -> None:
+        """Проверка, что value можно поставить на позицию index.
+
+        replace=True - value заменяет элемент index, а не вставляется перед ним.
+        """
+        if index > 0 and self.data[index - 1] > value:
+            raise ValueError(f"Значение {value} нарушает порядок на позиции {index}")
+        following = index + 1 if replace else index
+        if following < self.size and value > self.data[following]:
+            raise ValueError(f"Значение {value} нарушает порядок на позиции {index}")
+
+    def pushBack(self, value) -> None:
+        """Добавление в конец, если value не меньше последнего. Сложность: O(1)"""
+        self._check_order(self.size, value)
+        super().pushBack(value)
+
+    def pushFront(self, value) -> None:
+        """Добавление в начало, если value не больше первого. Сложность: O(n)"""
+        self._check_order(0, value)
+        super().pushFront(value)
+
+    def insert(self, index: int, value) -> None:
+        """Вставка по индексу с проверкой порядка. Сложность: O(n)"""
+        if 0 <= index <= self.size:
+            self._check_order(index, value)
+        super().insert(index, value)
+
+    def set(self, index: int, value) -> None:
+        """Замена элемента с проверкой порядка. Сложность: O(1)"""
+        if 0 <= index < self.size:
+            self._check_order(index, value, replace=True)
+        super().set(index, value)
+
+    def insert_many(self, index: int, iterable) -> None:
+        """Вставка упорядоченной пачки по индексу с проверкой порядка. Сложность: O(n + k)"""
+        values = self._pack(iterable)
+        if any(values[i] > values[i + 1] for i in range(len(values) - 1)):
+            raise ValueError("Вставляемые значения должны быть упорядочены")
+        if values and 0 <= index <= self.size:
+            self._check_order(index, values[0])
+            self._check_order(index, values[-1])
+        super().insert_many(index, values)
+
+    def add(self, value) -> int:
+        """Вставка с сохранением порядка (позиция ищется через bisect).
+
+        Сложность: O(log n) на поиск + O(n) на сдвиг.
+
+        Returns:
+            Индекс, на который встал элемент.
+        """
+        index = bisect.bisect_right(self.data, value, 0, self.size)
+        super().insert(index, value)
+        return index
+
+    def lower_bound(self, value) -> int:
+        """Индекс первого элемента >= value. Сложность: O(log n)"""
+        return bisect.bisect_left(self.data, value, 0, self.size)
+
+    def upper_bound(self, value) -> int:
+        """Индекс первого элемента > value. Сложность: O(log n)"""
+        return bisect.bisect_right(self.data, value, 0, self.size)
+
+    def find(self, value) -> int:
+        """Двоичный поиск элемента. Сложность: O(log n)
+
+        Returns:
+            Индекс первого вхождения или -1 если не найден.
+        """
+        index = self.lower_bound(value)
+        if index < self.size and self.data[index] == value:
+            return index
+        return -1
+
+    def count_range(self, low, high) -> int:
+        """Количество элементов x, для которых low <= x <= high. Сложность: O(log n)"""
+        if high < low:
+            return 0
+        return self.upper_bound(high) - self.lower_bound(low)
+
+    def merge_sorted(self, iterable) -> None:
+        """Слияние с упорядоченной пачкой за один линейный проход.
+
+        Слияние идет с конца массива в свободные ячейки,
+        поэтому дополнительная память нужна только под саму пачку.
+        Сложность: O(n + k)
+        """
+        values = self._pack(iterable)
+        count = len(values)
+        if any(values[i] > values[i + 1] for i in range(count - 1)):
+            raise ValueError("Сливаемые значения должны быть упорядочены")
+        if self.size + count > self.capacity:
+            raise Exception(f"Массив переполнен! Емкость: {self.capacity}")
+
+        i = self.size - 1
+        j = count - 1
+        write = self.size + count - 1
+        while j >= 0:
+            # При равенстве старые элементы остаются левее новых
+            if i >= 0 and self.data[i] > values[j]:
+                self.data[write] = self.data[i]
+                i -= 1
+            else:
+                self.data[write] = values[j]
+                j -= 1
+            write -= 1
+        self.size += count
+        if self._indexes:
+            self._notify_shift(0)
+
+
+class SparseArray:
+    """Разреженный массив: хранит только занятые ячейки в хэш-таблице.
+
+    Индексация та же, что у таблицы слотов на StaticArray: ячейки
+    [0, capacity), пустая ячейка возвращает None. Память зависит от числа
+    занятых ячеек, а не от емкости. Для плотных данных выгоднее обычный
+    StaticArray - переход между видами делают from_static/to_static.
+    """
+
+    def __init__(self, capacity: int):
+        """Инициализация разреженного массива.
+
+        Args:
+            capacity: Количество адресуемых ячеек
+        """
+        self.capacity = capacity
+        self.slots = {}  # индекс -> значение (только занятые ячейки)
+
+    def _check_index(self, index: int) -> None:
+        if index < 0 or index >= self.capacity:
+            raise IndexError(f"Индекс {index} вне диапазона [0, {self.capacity-1}]")
+
+    def get(self, index: int):
+        """Значение ячейки (None для пустой). Сложность: O(1) в среднем"""
+        self._check_index(index)
+        return self.slots.get(index)
+
+    def set(self, index: int, value) -> None:
+        """Запись в ячейку; запись None освобождает ячейку. Сложность: O(1) в среднем"""
+        self._check_index(index)
+        if value is None:
+            self.slots.pop(index, None)
+        else:
+            self.slots[index] = value
+
+    def delete(self, index: int) -> None:
+        """Освобождение ячейки. Сложность: O(1) в среднем"""
+        self.set(index, None)
+
+    def __getitem__(self, index: int):
+        return self.get(index)
+
+    def __setitem__(self, index: int, value) -> None:
+        self.set(index, value)
+
+    def items(self):
+        """Пары (индекс, значение) занятых ячеек по возрастанию индекса.
+
+        Сложность: O(k log k), где k - число занятых ячеек.
+        """
+        for index in sorted(self.slots):
+            yield index, self.slots[index]
+
+    def __iter__(self):
+        """Значения занятых ячеек по возрастанию индекса."""
+        for _, value in self.items():
+            yield value
+
+    def find(self, value) -> int:
+        """Наименьший индекс ячейки со значением value или -1. Сложность: O(k)"""
+        return min((i for i, v in self.slots.items() if v == value), default=-1)
+
+    def get_size(self) -> int:
+        """Количество занятых ячеек."""
+        return len(self.slots)
+
+    def get_capacity(self) -> int:
+        """Количество адресуемых ячеек."""
+        return self.capacity
+
+    def density(self) -> float:
+        """Доля занятых ячеек."""
+        return len(self.slots) / self.capacity if self.capacity else 0.0
+
+    @classmethod
+    def from_static(cls, arr: StaticArray) -> "SparseArray":
+        """Построение из StaticArray (ячейки со значением None пропускаются). Сложность: O(n)"""
+        sparse = cls(arr.capacity)
+        for i in range(arr.size):
+            if arr.data[i] is not None:
+                sparse.slots[i] = arr.data[i]
+        return sparse
+
+    def to_static(self) -> StaticArray:
+        """Плотный StaticArray той же емкости; пустые ячейки становятся None.
+
+        Размер результата - последний занятый индекс + 1. Сложность: O(capacity)
+        """
+        arr = StaticArray(self.capacity)
+        for index, value in self.slots.items():
+            arr.data[index] = value
+        arr.size = max(self.slots) + 1 if self.slots else 0
+        return arr
+
+    def __str__(self) -> str:
+        """Строковое представление занятых ячеек."""
+        cells = ", ".join(f"{i}: {v}" for i, v in self.items())
+        return f"{{{cells}}} (occupied={len(self.slots)}, capacity={self.capacity})"
+
+
+def choose_representation(arr, threshold: float = 0.1):
+    """Выбор вида таблицы слотов по плотности заполнения.
+
+    Возвращает SparseArray, если занято меньше threshold ячеек,
+    иначе StaticArray. Уже подходящий массив возвращается как есть.
+    """
+    if isinstance(arr, SparseArray):
+        return arr.to_static() if arr.density() >= threshold else arr
+    occupied = sum(1 for i in range(arr.size) if arr.data[i] is not None)
+    if arr.capacity and occupied / arr.capacity < threshold:
+        return SparseArray.from_static(arr)
+    return arr
+
+
+class GapBufferArray:
+    """Статический массив на основе буфера с разрывом (gap buffer).
+
+    Свободное место хранится не в конце, а в "разрыве" у курсора:
+    data[0:gap_start] - элементы до курсора,
+    data[gap_end:capacity] - элементы после курсора.
+    Правки у курсора стоят O(1), перемещение курсора - O(расстояния).
+    """
+
+    def __init__(self, capacity: int):
+        """Инициализация буфера с разрывом.
+
+        Args:
+            capacity: Максимальное количество элементов
+        """
+        self.capacity = capacity
+        self.size = 0
+        self.data = [None] * capacity
+        self.gap_start = 0  # Позиция курсора
+        self.gap_end = capacity
+
+    def _move_gap(self, position: int) -> None:
+        """Перемещение разрыва к логической позиции.
+
+        Сложность: O(|position - cursor|) - переносятся только элементы между ними.
+        """
+        gap = self.gap_end - self.gap_start
+        if position < self.gap_start:
+            count = self.gap_start - position
+            self.data[self.gap_end - count:self.gap_end] = self.data[position:self.gap_start]
+            # Очищаем освободившиеся слоты, чтобы не держать лишних ссылок
+            stale = min(count, gap)
+            self.data[position:position + stale] = [None] * stale
+        elif position > self.gap_start:
+            count = position - self.gap_start
+            self.data[self.gap_start:position] = self.data[self.gap_end:self.gap_end + count]
+            stale = min(count, gap)
+            self.data[self.gap_end + count - stale:self.gap_end + count] = [None] * stale
+        else:
+            return
+        self.gap_start = position
+        self.gap_end = position + gap
+
+    def _physical(self, index: int) -> int:
+        """Перевод логического индекса в индекс буфера."""
+        if index < self.gap_start:
+            return index
+        return index + self.gap_end - self.gap_start
+
+    def move_cursor(self, position: int) -> None:
+        """Перемещение курсора. Сложность: O(расстояния)"""
+        if position < 0 or position > self.size:
+            raise IndexError(f"Позиция {position} вне диапазона [0, {self.size}]")
+        self._move_gap(position)
+
+    def get_cursor(self) -> int:
+        """Возвращает текущую позицию курсора."""
+        return self.gap_start
+
+    def insert_at_cursor(self, value) -> None:
+        """Вставка перед курсором, курсор сдвигается вправо. Сложность: O(1)"""
+        if self.size >= self.capacity:
+            raise Exception(f"Массив переполнен! Емкость: {self.capacity}")
+        self.data[self.gap_start] = value
+        self.gap_start += 1
+        self.size += 1
+
+    def delete_before_cursor(self):
+        """Удаление элемента перед курсором (Backspace). Сложность: O(1)"""
+        if self.gap_start == 0:
+            raise IndexError("Перед курсором нет элементов")
+        self.gap_start -= 1
+        value = self.data[self.gap_start]
+        self.data[self.gap_start] = None
+        self.size -= 1
+        return value
+
+    def delete_at_cursor(self):
+        """Удаление элемента после курсора (Delete). Сложность: O(1)"""
+        if self.gap_end == self.capacity:
+            raise IndexError("После курсора нет элементов")
+        value = self.data[self.gap_end]
+        self.data[self.gap_end] = None
+        self.gap_end += 1
+        self.size -= 1
+        return value
+
+    def pushBack(self, value) -> None:
+        """Добавление в конец. Сложность: O(расстояния от курсора до конца)"""
+        self.insert(self.size, value)
+
+    def pushFront(self, value) -> None:
+        """Добавление в начало. Сложность: O(расстояния от курсора до начала)"""
+        self.insert(0, value)
+
+    def insert(self, index: int, value) -> None:
+        """Вставка по индексу: курсор переносится к index. Сложность: O(расстояния)"""
+        if self.size >= self.capacity:
+            raise Exception(f"Массив переполнен! Емкость: {self.capacity}")
+        if index < 0 or index > self.size:
+            raise IndexError(f"Индекс {index} вне диапазона [0, {self.size}]")
+        self._move_gap(index)
+        self.insert_at_cursor(value)
+
+    def remove(self, index: int) -> None:
+        """Удаление по индексу: курсор переносится к index. Сложность: O(расстояния)"""
+        if index < 0 or index >= self.size:
+            raise IndexError(f"Индекс {index} вне диапазона [0, {self.size-1}]")
+        self._move_gap(index)
+        self.delete_at_cursor()
+
+    def get(self, index: int):
+        """Получение элемента по индексу. Сложность: O(1)"""
+        if index < 0 or index >= self.size:
+            raise IndexError(f"Индекс {index} вне диапазона [0, {self.size-1}]")
+        return self.data[self._physical(index)]
+
+    def find(self, value) -> int:
+        """Поиск элемента по значению. Сложность: O(n)"""
+        for i in range(self.gap_start):
+            if self.data[i] == value:
+                return i
+        shift = self.gap_end - self.gap_start
+        for i in range(self.gap_end, self.capacity):
+            if self.data[i] == value:
+                return i - shift
+        return -1
+
+    def __str__(self) -> str:
+        """Строковое представление массива."""
+        return f"[{', '.join(str(self.get(i)) for i in range(self.size))}]"
+
+    def get_capacity(self) -> int:
+        """Возвращает емкость массива."""
+        return self.capacity
+
+    def get_size(self) -> int:
+        """Возвращает текущий размер массива."""
+        return self.size
 
 
 # ===== Демонстрация работы статического массива =====
@@ -200,7 +1302,297 @@ def complexity_analysis():
         print(f"  {operation:20} → {complexity}")
 
 
+# ===== Сравнение обычного и типизированного хранилища =====
+def compare_typed_storage():
+    print("\n" + "=" * 60)
+    print("СРАВНЕНИЕ ОБЫЧНОГО И ТИПИЗИРОВАННОГО ХРАНИЛИЩА")
+    print("=" * 60)
+
+    n_elements = 5000
+
+    results = {}
+    for name, arr in [("StaticArray", StaticArray(n_elements)),
+                      ("TypedStaticArray", TypedStaticArray(n_elements, 'q'))]:
+        start_time = time.time()
+        for i in range(n_elements):
+            arr.pushFront(i)
+        for _ in range(n_elements):
+            arr.remove(0)
+        results[name] = time.time() - start_time
+        print(f"  {name:18}: {results[name]:.4f} сек на {n_elements} pushFront + remove(0)")
+
+    plain = StaticArray(n_elements)
+    typed = TypedStaticArray(n_elements, 'q')
+    for i in range(n_elements):
+        plain.pushBack(i + 1000)
+        typed.pushBack(i + 1000)
+
+    # Для обычного массива учитываем и список указателей, и сами объекты int
+    plain_bytes = sys.getsizeof(plain.data) + sum(sys.getsizeof(v) for v in plain.data)
+    typed_bytes = sys.getsizeof(typed.data)
+    print(f"  Память StaticArray:      ~{plain_bytes / n_elements:.1f} байт на элемент")
+    print(f"  Память TypedStaticArray: ~{typed_bytes / n_elements:.1f} байт на элемент")
+    print(f"  Ускорение сдвигов: {results['StaticArray'] / results['TypedStaticArray']:.1f}x")
+
+
+# ===== Сравнение на трассе правок у курсора =====
+def compare_gap_buffer():
+    print("\n" + "=" * 60)
+    print("БУФЕР С РАЗРЫВОМ: ТРАССА ПРАВОК У КУРСОРА")
+    print("=" * 60)
+
+    random.seed(42)
+    initial_size = 10000
+    n_edits = 20000
+    capacity = initial_size + n_edits
+
+    # Трасса: правки идут в середине уже заполненного массива,
+    # курсор блуждает рядом с текущей позицией
+    trace = []
+    size = initial_size
+    cursor = initial_size // 2
+    for _ in range(n_edits):
+        cursor = max(0, min(size, cursor + random.randint(-3, 3)))
+        if size > 0 and cursor < size and random.random() < 0.3:
+            trace.append(("remove", cursor))
+            size -= 1
+        else:
+            trace.append(("insert", cursor))
+            size += 1
+            cursor += 1
+
+    results = {}
+    for name, arr in [("StaticArray", StaticArray(capacity)),
+                      ("GapBufferArray", GapBufferArray(capacity))]:
+        for i in range(initial_size):
+            arr.pushBack(i)
+        start_time = time.time()
+        for op, position in trace:
+            if op == "insert":
+                arr.insert(position, position)
+            else:
+                arr.remove(position)
+        results[name] = time.time() - start_time
+        print(f"  {name:16}: {results[name]:.4f} сек на {n_edits} правок (итоговый размер {arr.get_size()})")
+
+    print(f"  Ускорение: {results['StaticArray'] / results['GapBufferArray']:.1f}x")
+
+
+# ===== Пакетные операции =====
+def compare_bulk_operations():
+    print("\n" + "=" * 60)
+    print("ПАКЕТНАЯ ВСТАВКА И УДАЛЕНИЕ")
+    print("=" * 60)
+
+    n_existing = 2000
+    batch = list(range(2000))
+
+    one_by_one = StaticArray(n_existing + len(batch))
+    bulk = StaticArray(n_existing + len(batch))
+    one_by_one.extend(range(n_existing))
+    bulk.extend(range(n_existing))
+
+    start_time = time.time()
+    for offset, value in enumerate(batch):
+        one_by_one.insert(offset, value)
+    for _ in batch:
+        one_by_one.remove(0)
+    single_time = time.time() - start_time
+
+    start_time = time.time()
+    bulk.insert_many(0, batch)
+    bulk.remove_range(0, len(batch))
+    bulk_time = time.time() - start_time
+
+    print(f"  insert/remove по одному: {single_time:.4f} сек (k сдвигов хвоста)")
+    print(f"  insert_many/remove_range: {bulk_time:.6f} сек (один сдвиг хвоста)")
+    print(f"  Результаты совпадают: {str(one_by_one) == str(bulk)}")
+
+
+# ===== Упорядоченный массив и двоичный поиск =====
+def compare_sorted_find():
+    print("\n" + "=" * 60)
+    print("УПОРЯДОЧЕННЫЙ МАССИВ: ДВОИЧНЫЙ ПОИСК")
+    print("=" * 60)
+
+    n_elements = 100000
+    n_lookups = 200
+
+    plain = StaticArray(n_elements)
+    ordered = SortedStaticArray(n_elements)
+    plain.extend(range(0, 2 * n_elements, 2))
+    ordered.merge_sorted(range(0, 2 * n_elements, 2))
+
+    random.seed(1)
+    queries = [random.randrange(2 * n_elements) for _ in range(n_lookups)]
+
+    start_time = time.time()
+    linear = [plain.find(q) for q in queries]
+    linear_time = time.time() - start_time
+
+    start_time = time.time()
+    binary = [ordered.find(q) for q in queries]
+    binary_time = time.time() - start_time
+
+    print(f"  Линейный поиск:  {linear_time:.4f} сек на {n_lookups} запросов")
+    print(f"  Двоичный поиск:  {binary_time:.4f} сек на {n_lookups} запросов")
+    print(f"  Результаты совпадают: {linear == binary}")
+    print(f"  Элементов в [1000, 2000]: {ordered.count_range(1000, 2000)}")
+
+
+# ===== Массив в файле через mmap =====
+def demonstrate_mapped_array():
+    print("\n" + "=" * 60)
+    print("МАССИВ В ФАЙЛЕ (MMAP)")
+    print("=" * 60)
+
+    n_elements = 1000000
+    path = os.path.join(tempfile.gettempdir(), "static_array_demo.bin")
+
+    start_time = time.time()
+    with MappedStaticArray(path, capacity=n_elements, typecode='q') as arr:
+        arr.extend(range(n_elements))
+        arr.remove(0)
+        arr.pushFront(0)
+    print(f"  Создание и запись {n_elements} элементов: {time.time() - start_time:.4f} сек")
+    print(f"  Размер файла: {os.path.getsize(path)} байт")
+
+    start_time = time.time()
+    with MappedStaticArray(path, readonly=True) as arr:
+        open_time = time.time() - start_time
+        print(f"  Открытие существующего файла: {open_time:.6f} сек (без копирования)")
+        print(f"  Размер: {arr.get_size()}, тип: '{arr.typecode}', последний: {arr.data[arr.size - 1]}")
+        print(f"  find(123456) = {arr.find(123456)}")
+
+    os.remove(path)
+
+
+# ===== Хэш-индекс для поиска =====
+def compare_indexed_find():
+    print("\n" + "=" * 60)
+    print("ПОИСК ЧЕРЕЗ ХЭШ-ИНДЕКС")
+    print("=" * 60)
+
+    n_elements = 100000
+    n_lookups = 200
+
+    plain = StaticArray(n_elements)
+    indexed = IndexedStaticArray(n_elements)
+    plain.extend(range(n_elements))
+    indexed.extend(range(n_elements))
+
+    random.seed(2)
+    queries = [random.randrange(2 * n_elements) for _ in range(n_lookups)]
+
+    start_time = time.time()
+    linear = [plain.find(q) for q in queries]
+    linear_time = time.time() - start_time
+
+    start_time = time.time()
+    hashed = [indexed.find(q) for q in queries]
+    hashed_time = time.time() - start_time
+
+    print(f"  Линейный поиск:   {linear_time:.4f} сек на {n_lookups} запросов")
+    print(f"  Поиск по индексу: {hashed_time:.6f} сек на {n_lookups} запросов")
+    print(f"  Результаты совпадают: {linear == hashed}")
+
+    indexed.remove(0)
+    indexed.pushBack(5)
+    print(f"  После remove(0) и pushBack(5): find(5) = {indexed.find(5)}, "
+          f"count(5) = {indexed.count(5)}, find_all(5) = {indexed.find_all(5)}")
+
+
+# ===== Индексы диапазонных запросов =====
+def compare_range_queries():
+    print("\n" + "=" * 60)
+    print("ИНДЕКСЫ ДИАПАЗОННЫХ ЗАПРОСОВ")
+    print("=" * 60)
+
+    n_elements = 100000
+    n_queries = 1000
+    random.seed(4)
+
+    arr = StaticArray(n_elements)
+    arr.extend(random.randrange(1000) for _ in range(n_elements - 1))
+    sums = FenwickIndex(arr)
+    minimums = SegmentTreeIndex(arr, min, float("inf"))
+    maximums = SparseTableIndex(arr, max)
+
+    queries = []
+    for _ in range(n_queries):
+        start = random.randrange(arr.size)
+        queries.append((start, random.randint(start + 1, arr.size)))
+
+    start_time = time.time()
+    naive = [(sum(arr.data[a:b]), min(arr.data[a:b]), max(arr.data[a:b])) for a, b in queries]
+    naive_time = time.time() - start_time
+
+    start_time = time.time()
+    sums.prefix_sum(0)
+    minimums.query(0, 0)
+    maximums.query(0, 1)
+    build_time = time.time() - start_time
+
+    start_time = time.time()
+    indexed = [(sums.range_sum(a, b), minimums.query(a, b), maximums.query(a, b)) for a, b in queries]
+    index_time = time.time() - start_time
+
+    print(f"  Проход по срезам: {naive_time:.4f} сек на {n_queries} запросов")
+    print(f"  Построение трех индексов: {build_time:.4f} сек")
+    print(f"  Запросы к индексам:       {index_time:.4f} сек на {n_queries} запросов")
+    print(f"  Результаты совпадают: {naive == indexed}")
+
+    arr.set(0, -5)
+    arr.pushBack(10000)
+    print(f"  После set(0, -5) и pushBack(10000): сумма всех = {sums.range_sum(0, arr.size)}, "
+          f"min = {minimums.query(0, arr.size)}, max = {maximums.query(0, arr.size)}")
+
+    words = StaticArray(5)
+    words.extend(["a", "b", "c", "d", "e"])
+    concat = SegmentTreeIndex(words, lambda x, y: x + y, "")
+    print(f"  Некоммутативная операция (конкатенация) на [1, 4): '{concat.query(1, 4)}'")
+
+
+# ===== Разреженный массив =====
+def demonstrate_sparse_array():
+    print("\n" + "=" * 60)
+    print("РАЗРЕЖЕННЫЙ МАССИВ")
+    print("=" * 60)
+
+    capacity = 10 ** 8
+    n_occupied = 100000
+    random.seed(5)
+
+    sparse = SparseArray(capacity)
+    for _ in range(n_occupied):
+        sparse.set(random.randrange(capacity), random.randrange(1000))
+
+    dense_bytes = 8 * capacity  # Только список указателей [None] * capacity
+    sparse_bytes = sys.getsizeof(sparse.slots)
+    print(f"  Емкость: {capacity}, занято: {sparse.get_size()} ({sparse.density():.3%})")
+    print(f"  Плотный StaticArray: ~{dense_bytes / 2**20:.0f} МБ только на указатели")
+    print(f"  SparseArray:         ~{sparse_bytes / 2**20:.1f} МБ на хэш-таблицу")
+
+    start_time = time.time()
+    total = sum(sparse)
+    print(f"  Сумма по занятым ячейкам: {total} ({time.time() - start_time:.4f} сек)")
+
+    small = StaticArray(10)
+    small.extend([None, 5, None, None, 7])
+    as_sparse = choose_representation(small, threshold=0.5)
+    print(f"  StaticArray {small} -> {type(as_sparse).__name__} {as_sparse}")
+    print(f"  Обратно: {as_sparse.to_static()}")
+
+
 # Запуск демонстрации
 if __name__ == "__main__":
     demonstrate_static_array()
-    complexity_analysis()
\ No newline at end of file
+    complexity_analysis()
+    compare_typed_storage()
+    compare_gap_buffer()
+    compare_bulk_operations()
+    compare_sorted_find()
+    demonstrate_mapped_array()
+    compare_indexed_find()
+    compare_range_queries()
+    demonstrate_sparse_array()
\ No newline at end of file
@@ -4,22 +4,74 @@
 Сравнение времени вставки 100000 элементов со статическим массивом.
 """
 
-import time
+import array
+import bisect
+import gc
+import itertools
+import os
+import random
+import struct
 import sys
+import tempfile
+import time
+
+from task_01_static_array import IndexedStorageMixin
+
+
+# ===== Стратегии роста емкости =====
+def grow_double(capacity: int) -> int:
+    """Стратегия ×2: меньше всего расширений, но до 50% пустой памяти."""
+    return capacity * 2
+
+
+def grow_one_and_half(capacity: int) -> int:
+    """Стратегия ×1.5: больше расширений, но меньше пустой памяти."""
+    return capacity + capacity // 2
 
-class DynamicArray:
-    """Динамический массив с автоматическим расширением."""
+
+def additive_growth(threshold: int, step: int):
+    """Стратегия ×2 до порога, затем прибавка фиксированного шага.
+
+    Args:
+        threshold: Емкость, после которой рост становится аддитивным
+        step: На сколько элементов увеличивать емкость после порога
+    """
+    def policy(capacity: int) -> int:
+        if capacity < threshold:
+            return capacity * 2
+        return capacity + step
+    return policy
+
+
+class DynamicArray(IndexedStorageMixin):
+    """Динамический массив с автоматическим расширением и сжатием."""
     
-    def __init__(self, initial_capacity: int = 4):
+    _empty = None  # Значение для очистки освободившихся ячеек
+    
+    def __init__(self, initial_capacity: int = 4, growth_policy=grow_double,
+                 auto_shrink: bool = False, on_resize=None):
         """Инициализация динамического массива.
         
         Args:
             initial_capacity: Начальная емкость массива
+            growth_policy: Функция capacity -> новая емкость (по умолчанию ×2)
+            auto_shrink: Уменьшать ли емкость вдвое при заполнении меньше 1/4
+            on_resize: Необязательная функция, получающая словарь события
+                каждого изменения емкости (old_capacity, new_capacity,
+                copied, elapsed_ns)
         """
         self.capacity = initial_capacity
         self.size = 0
-        self.data = [None] * initial_capacity
+        self.data = self._allocate(initial_capacity)
+        self.growth_policy = growth_policy
+        self.auto_shrink = auto_shrink
+        self.min_capacity = initial_capacity  # Ниже этой емкости не сжимаемся
         self.expansions = 0  # Счетчик расширений
+        self.shrinks = 0  # Счетчик сжатий
+        self.peak_capacity = initial_capacity
+        self.on_resize = on_resize
+        self.copied_total = 0  # Сколько элементов скопировано при всех изменениях емкости
+        self.resize_time_ns = 0  # Суммарное время изменений емкости
     
     def append(self, value) -> None:
         """Добавление элемента в конец массива.
@@ -28,25 +80,147 @@ class DynamicArray:
         В худшем случае (при расширении): O(n)
         """
         if self.size >= self.capacity:
-            self._resize(self.capacity * 2)  # Стратегия увеличения ×2
+            self._grow(self.size + 1)
         
         self.data[self.size] = value
         self.size += 1
+        if self._indexes:
+            self._notify_point(self.size - 1)
     
-    def _resize(self, new_capacity: int) -> None:
-        """Внутренний метод для изменения размера массива.
+    def extend(self, iterable) -> None:
+        """Добавление всех элементов последовательности в конец.
         
-        Сложность: O(n) - копирование всех элементов.
+        Длина известна заранее (для итераторов без len() они сначала
+        собираются в список), поэтому расширение происходит не более
+        одного раза, а элементы записываются одним срезом.
+        Сложность: O(k)
         """
+        values = self._pack(iterable)
+        count = len(values)
+        if self.size + count > self.capacity:
+            self._grow(self.size + count)
+        
+        self.data[self.size:self.size + count] = values
+        self.size += count
+        if self._indexes:
+            self._notify_shift(self.size - count)
+    
+    def reserve(self, capacity: int) -> None:
+        """Заранее выделить емкость не меньше capacity. Сложность: O(n)"""
+        if capacity > self.capacity:
+            self.expansions += 1
+            self._resize(capacity)
+    
+    @classmethod
+    def from_iterable(cls, iterable, **kwargs) -> "DynamicArray":
+        """Создание массива из последовательности с одним выделением памяти.
+        
+        Args:
+            iterable: Исходные элементы
+            **kwargs: Параметры конструктора (growth_policy, auto_shrink, ...)
+        """
+        arr = cls(**kwargs)
+        arr.extend(iterable)
+        return arr
+    
+    def insert(self, index: int, value) -> None:
+        """Вставка элемента по индексу.
+        
+        Сложность: O(n) - сдвиг хвоста вправо.
+        """
+        if index < 0 or index > self.size:
+            raise IndexError(f"Индекс {index} вне диапазона [0, {self.size}]")
+        if self.size >= self.capacity:
+            self._grow(self.size + 1)
+        
+        self.data[index + 1:self.size + 1] = self.data[index:self.size]
+        self.data[index] = value
+        self.size += 1
+        if self._indexes:
+            self._notify_shift(index)
+    
+    def pop(self, index: int = None):
+        """Удаление и возврат элемента (по умолчанию последнего).
+        
+        Сложность: O(1) для последнего элемента, O(n) для произвольного.
+        """
+        if index is None:
+            index = self.size - 1
+        if index < 0 or index >= self.size:
+            raise IndexError(f"Индекс {index} вне диапазона [0, {self.size-1}]")
+        
+        value = self.data[index]
+        self.data[index:self.size - 1] = self.data[index + 1:self.size]
+        self.size -= 1
+        self.data[self.size] = self._empty
+        if self._indexes:
+            self._notify_shift(index)
+        self._maybe_shrink()
+        return value
+    
+    def remove(self, index: int) -> None:
+        """Удаление элемента по индексу. Сложность: O(n)"""
+        self.pop(index)
+    
+    def shrink_to_fit(self) -> None:
+        """Уменьшение емкости до текущего размера. Сложность: O(n)"""
+        if self.capacity != self.size:
+            self.shrinks += 1
+            self._resize(self.size)
+    
+    def _grow(self, min_capacity: int) -> None:
+        """Расширение по выбранной стратегии (не меньше min_capacity)."""
         self.expansions += 1
-        print(f"  Расширение массива: {self.capacity} → {new_capacity}")
+        self._resize(max(self.growth_policy(self.capacity), min_capacity))
+    
+    def _maybe_shrink(self) -> None:
+        """Сжатие вдвое при заполнении меньше чем на 1/4.
+        
+        Гистерезис: после сжатия массив заполнен меньше чем наполовину,
+        поэтому чередование append/pop не вызывает постоянных перевыделений.
+        """
+        if not self.auto_shrink or self.capacity <= self.min_capacity:
+            return
+        if self.size < self.capacity // 4:
+            self.shrinks += 1
+            self._resize(max(self.capacity // 2, self.min_capacity))
+    
+    def _allocate(self, count: int) -> list:
+        """Новое хранилище из count пустых ячеек."""
+        return [None] * count
+    
+    def _pack(self, values):
+        """Приведение последовательности к виду, пригодному для записи срезом."""
+        return values if hasattr(values, "__len__") else list(values)
+    
+    def _empty_like(self) -> "DynamicArray":
+        """Пустой массив с теми же настройками (для срезов)."""
+        return DynamicArray(growth_policy=self.growth_policy)
+    
+    def _resize(self, new_capacity: int) -> None:
+        """Внутренний метод для изменения размера массива.
         
-        new_data = [None] * new_capacity
-        for i in range(self.size):
-            new_data[i] = self.data[i]
+        Сложность: O(n) - копирование всех элементов одним срезом.
+        """
+        start_ns = time.perf_counter_ns()
+        old_capacity = self.capacity
         
-        self.data = new_data
+        self.data = self.data[:self.size] + self._allocate(new_capacity - self.size)
         self.capacity = new_capacity
+        
+        elapsed_ns = time.perf_counter_ns() - start_ns
+        if self._indexes:
+            self._notify_shift(0)  # Емкость изменилась - индексы перестраиваются
+        self.peak_capacity = max(self.peak_capacity, new_capacity)
+        self.copied_total += self.size
+        self.resize_time_ns += elapsed_ns
+        if self.on_resize is not None:
+            self.on_resize({
+                "old_capacity": old_capacity,
+                "new_capacity": new_capacity,
+                "copied": self.size,
+                "elapsed_ns": elapsed_ns,
+            })
     
     def get(self, index: int):
         """Получение элемента по индексу.
@@ -57,6 +231,33 @@ class DynamicArray:
             raise IndexError(f"Индекс {index} вне диапазона [0, {self.size-1}]")
         return self.data[index]
     
+    def __len__(self) -> int:
+        """Количество элементов."""
+        return self.size
+    
+    def __iter__(self):
+        """Итерация по элементам без вызова get() на каждый элемент."""
+        return itertools.islice(self.data, self.size)
+    
+    def __getitem__(self, key):
+        """Доступ по индексу (в том числе отрицательному) или срезу.
+        
+        Срез возвращает новый DynamicArray. Сложность: O(1) / O(k)
+        """
+        if isinstance(key, slice):
+            start, stop, step = key.indices(self.size)
+            if step > 0:
+                values = self.data[start:stop:step]
+            else:
+                # Для отрицательного шага stop может быть -1, поэтому режем живую часть
+                values = self.data[:self.size][key]
+            result = self._empty_like()
+            result.extend(values)
+            return result
+        if key < 0:
+            key += self.size
+        return self.get(key)
+    
     def __str__(self) -> str:
         """Строковое представление массива."""
         elements = [str(self.data[i]) for i in range(self.size)]
@@ -67,12 +268,366 @@ class DynamicArray:
         return {
             "size": self.size,
             "capacity": self.capacity,
+            "peak_capacity": self.peak_capacity,
             "expansions": self.expansions,
+            "shrinks": self.shrinks,
+            "copied_total": self.copied_total,
+            "resize_time_ns": self.resize_time_ns,
             "load_factor": self.size / self.capacity if self.capacity > 0 else 0,
             "memory_usage": sys.getsizeof(self.data) + sys.getsizeof(self)  # Байты
         }
 
 
+class TypedDynamicArray(DynamicArray):
+    """Динамический массив чисел в типизированном буфере array.array.
+
+    Элементы хранятся подряд в памяти (8 байт на 'q'/'d' вместо
+    указателя и отдельного объекта). Содержимое доступно без копирования
+    через memoryview, поэтому его можно сразу передать в file.write,
+    struct.unpack_from или numpy.frombuffer.
+    """
+
+    _empty = 0
+
+    def __init__(self, typecode: str = 'q', initial_capacity: int = 4, **kwargs):
+        """Инициализация типизированного динамического массива.
+
+        Args:
+            typecode: Код типа элементов модуля array ('q', 'd', 'i', ...)
+            initial_capacity: Начальная емкость массива
+            **kwargs: Остальные параметры DynamicArray
+        """
+        self.typecode = typecode
+        super().__init__(initial_capacity, **kwargs)
+
+    def _allocate(self, count: int) -> array.array:
+        return array.array(self.typecode, bytes(array.array(self.typecode).itemsize * count))
+
+    def _pack(self, values) -> array.array:
+        return array.array(self.typecode, values)
+
+    def _empty_like(self) -> "TypedDynamicArray":
+        return TypedDynamicArray(self.typecode, growth_policy=self.growth_policy)
+
+    def as_memoryview(self) -> memoryview:
+        """Представление заполненной части буфера без копирования.
+
+        При расширении массив переезжает в новый буфер, поэтому
+        представление, полученное до расширения, показывает старые данные.
+        """
+        return memoryview(self.data)[:self.size]
+
+    def __buffer__(self, flags: int) -> memoryview:
+        """Протокол буфера (Python 3.12+): memoryview(arr), bytes(arr) и т.п."""
+        return self.as_memoryview()
+
+    def tobytes(self) -> bytes:
+        """Копия заполненной части в виде bytes."""
+        return self.as_memoryview().tobytes()
+
+
+class SegmentedArray:
+    """Динамический массив из блоков фиксированного размера (block list).
+
+    Элементы лежат в блоках по block_size ячеек, а список блоков
+    (каталог) хранит ссылки на них. При росте добавляется новый блок,
+    старые элементы никогда не копируются, поэтому задержка одного
+    append не зависит от n. Размер блока - степень двойки, и индекс
+    раскладывается на номер блока и смещение битовыми операциями.
+    """
+
+    def __init__(self, block_bits: int = 10):
+        """Инициализация массива из блоков.
+
+        Args:
+            block_bits: Размер блока в виде степени двойки (10 -> 1024 ячейки)
+        """
+        self.block_bits = block_bits
+        self.block_size = 1 << block_bits
+        self.mask = self.block_size - 1
+        self.blocks = []  # Каталог блоков
+        self.size = 0
+        self._spare = None  # Запасной блок, чтобы append/pop на границе не выделяли память
+
+    def append(self, value) -> None:
+        """Добавление в конец. Сложность: O(1) в худшем случае (без копирования)."""
+        offset = self.size & self.mask
+        if offset == 0:
+            if self._spare is not None:
+                block, self._spare = self._spare, None
+            else:
+                block = [None] * self.block_size
+            self.blocks.append(block)
+        self.blocks[-1][offset] = value
+        self.size += 1
+
+    def extend(self, iterable) -> None:
+        """Добавление всех элементов последовательности. Сложность: O(k)"""
+        for value in iterable:
+            self.append(value)
+
+    def pop(self):
+        """Удаление и возврат последнего элемента. Сложность: O(1)"""
+        if self.size == 0:
+            raise IndexError("Массив пуст")
+        self.size -= 1
+        offset = self.size & self.mask
+        block = self.blocks[-1]
+        value = block[offset]
+        block[offset] = None
+        if offset == 0:
+            self._spare = self.blocks.pop()
+        return value
+
+    def get(self, index: int):
+        """Получение элемента по индексу. Сложность: O(1)"""
+        if index < 0 or index >= self.size:
+            raise IndexError(f"Индекс {index} вне диапазона [0, {self.size-1}]")
+        return self.blocks[index >> self.block_bits][index & self.mask]
+
+    def set(self, index: int, value) -> None:
+        """Замена элемента по индексу. Сложность: O(1)"""
+        if index < 0 or index >= self.size:
+            raise IndexError(f"Индекс {index} вне диапазона [0, {self.size-1}]")
+        self.blocks[index >> self.block_bits][index & self.mask] = value
+
+    def __len__(self) -> int:
+        return self.size
+
+    def __getitem__(self, index: int):
+        return self.get(index)
+
+    def __iter__(self):
+        """Итерация по блокам без пересчета индексов."""
+        remaining = self.size
+        for block in self.blocks:
+            yield from itertools.islice(block, min(remaining, self.block_size))
+            remaining -= self.block_size
+
+    def __str__(self) -> str:
+        """Строковое представление массива."""
+        return f"[{', '.join(str(v) for v in self)}] (size={self.size}, blocks={len(self.blocks)})"
+
+    def get_stats(self) -> dict:
+        """Возвращает статистику по массиву."""
+        return {
+            "size": self.size,
+            "blocks": len(self.blocks),
+            "block_size": self.block_size,
+            "capacity": len(self.blocks) * self.block_size,
+            "load_factor": self.size / (len(self.blocks) * self.block_size) if self.blocks else 0,
+        }
+
+
+class SortedChunkList:
+    """Упорядоченная коллекция из ограниченных блоков DynamicArray.
+
+    Элементы хранятся в блоках длиной от load/2 до 2*load, блоки упорядочены
+    между собой. Список максимумов блоков позволяет двоичным поиском найти
+    нужный блок, а дерево Фенвика по длинам блоков - блок по позиции.
+    Вставка сдвигает элементы только внутри одного короткого блока.
+    Переполненный блок делится пополам, слишком короткий - сливается с соседом.
+    """
+
+    def __init__(self, iterable=(), load: int = 1000):
+        """Инициализация коллекции.
+
+        Args:
+            iterable: Начальные элементы (в любом порядке)
+            load: Целевой размер блока
+        """
+        self.load = load
+        self.blocks = []  # Блоки DynamicArray
+        self.maxes = []  # Максимум каждого блока
+        self.size = 0
+        self._tree = [0]  # Дерево Фенвика по длинам блоков (индексация с 1)
+        values = sorted(iterable)
+        for i in range(0, len(values), load):
+            self.blocks.append(DynamicArray.from_iterable(values[i:i + load]))
+            self.maxes.append(values[min(i + load, len(values)) - 1])
+        self.size = len(values)
+        self._rebuild_tree()
+
+    # ----- Дерево Фенвика по длинам блоков -----
+    def _rebuild_tree(self) -> None:
+        """Построение дерева длин блоков. Сложность: O(число блоков)"""
+        tree = [0] * (len(self.blocks) + 1)
+        for i, block in enumerate(self.blocks, 1):
+            tree[i] += block.size
+            parent = i + (i & -i)
+            if parent < len(tree):
+                tree[parent] += tree[i]
+        self._tree = tree
+
+    def _update_length(self, pos: int, delta: int) -> None:
+        """Изменение длины блока pos на delta. Сложность: O(log B)"""
+        i = pos + 1
+        while i < len(self._tree):
+            self._tree[i] += delta
+            i += i & -i
+
+    def _prefix(self, pos: int) -> int:
+        """Количество элементов в блоках [0, pos). Сложность: O(log B)"""
+        total = 0
+        while pos > 0:
+            total += self._tree[pos]
+            pos -= pos & -pos
+        return total
+
+    def _locate(self, index: int):
+        """Номер блока и смещение в нем для позиции index. Сложность: O(log B)"""
+        pos = 0
+        step = 1 << (len(self._tree) - 1).bit_length()
+        while step:
+            if pos + step < len(self._tree) and self._tree[pos + step] <= index:
+                pos += step
+                index -= self._tree[pos]
+            step >>= 1
+        return pos, index
+
+    # ----- Изменение -----
+    def add(self, value) -> None:
+        """Добавление с сохранением порядка. Сложность: O(log n + load)"""
+        if not self.blocks:
+            self.blocks.append(DynamicArray.from_iterable([value]))
+            self.maxes.append(value)
+            self.size = 1
+            self._rebuild_tree()
+            return
+
+        pos = bisect.bisect_right(self.maxes, value)
+        if pos == len(self.blocks):
+            pos -= 1
+            self.blocks[pos].append(value)
+            self.maxes[pos] = value
+        else:
+            block = self.blocks[pos]
+            block.insert(bisect.bisect_right(block.data, value, 0, block.size), value)
+        self.size += 1
+        self._update_length(pos, 1)
+
+        if self.blocks[pos].size > 2 * self.load:
+            self._split(pos)
+
+    def remove(self, value) -> None:
+        """Удаление одного вхождения value. Сложность: O(log n + load)
+
+        Raises:
+            ValueError: если значения нет в коллекции
+        """
+        pos = bisect.bisect_left(self.maxes, value)
+        if pos == len(self.blocks):
+            raise ValueError(f"Значение {value} не найдено")
+        block = self.blocks[pos]
+        index = bisect.bisect_left(block.data, value, 0, block.size)
+        if block.data[index] != value:
+            raise ValueError(f"Значение {value} не найдено")
+
+        block.pop(index)
+        self.size -= 1
+        if block.size == 0:
+            del self.blocks[pos]
+            del self.maxes[pos]
+            self._rebuild_tree()
+            return
+        self.maxes[pos] = block.data[block.size - 1]
+        self._update_length(pos, -1)
+        if block.size < self.load // 2 and len(self.blocks) > 1:
+            self._merge(pos)
+
+    def _split(self, pos: int) -> None:
+        """Деление переполненного блока пополам."""
+        block = self.blocks[pos]
+        half = block.size // 2
+        left, right = block[:half], block[half:]
+        self.blocks[pos:pos + 1] = [left, right]
+        self.maxes[pos:pos + 1] = [left.data[left.size - 1], right.data[right.size - 1]]
+        self._rebuild_tree()
+
+    def _merge(self, pos: int) -> None:
+        """Слияние короткого блока с соседом (и повторное деление при переполнении)."""
+        if pos == len(self.blocks) - 1:
+            pos -= 1
+        merged = self.blocks[pos]
+        merged.extend(self.blocks[pos + 1])
+        del self.blocks[pos + 1]
+        del self.maxes[pos + 1]
+        self.maxes[pos] = merged.data[merged.size - 1]
+        if merged.size > 2 * self.load:
+            self._split(pos)
+        else:
+            self._rebuild_tree()
+
+    # ----- Поиск -----
+    def bisect_left(self, value) -> int:
+        """Позиция первого элемента >= value. Сложность: O(log n)"""
+        pos = bisect.bisect_left(self.maxes, value)
+        if pos == len(self.blocks):
+            return self.size
+        block = self.blocks[pos]
+        return self._prefix(pos) + bisect.bisect_left(block.data, value, 0, block.size)
+
+    def bisect_right(self, value) -> int:
+        """Позиция первого элемента > value. Сложность: O(log n)"""
+        pos = bisect.bisect_right(self.maxes, value)
+        if pos == len(self.blocks):
+            return self.size
+        block = self.blocks[pos]
+        return self._prefix(pos) + bisect.bisect_right(block.data, value, 0, block.size)
+
+    def count(self, value) -> int:
+        """Количество вхождений value. Сложность: O(log n)"""
+        return self.bisect_right(value) - self.bisect_left(value)
+
+    def __contains__(self, value) -> bool:
+        pos = bisect.bisect_left(self.maxes, value)
+        if pos == len(self.blocks):
+            return False
+        block = self.blocks[pos]
+        index = bisect.bisect_left(block.data, value, 0, block.size)
+        return block.data[index] == value
+
+    def __len__(self) -> int:
+        return self.size
+
+    def __getitem__(self, index: int):
+        """Элемент по позиции в порядке возрастания. Сложность: O(log n)"""
+        if index < 0:
+            index += self.size
+        if index < 0 or index >= self.size:
+            raise IndexError(f"Индекс {index} вне диапазона [0, {self.size-1}]")
+        pos, offset = self._locate(index)
+        return self.blocks[pos].data[offset]
+
+    def __iter__(self):
+        for block in self.blocks:
+            yield from block
+
+    def irange(self, minimum, maximum):
+        """Итерация по элементам minimum <= x <= maximum.
+
+        Сложность: O(log n) на поиск начала + O(k) на выдачу.
+        """
+        pos = bisect.bisect_left(self.maxes, minimum)
+        if pos == len(self.blocks):
+            return
+        block = self.blocks[pos]
+        offset = bisect.bisect_left(block.data, minimum, 0, block.size)
+        while pos < len(self.blocks):
+            block = self.blocks[pos]
+            for i in range(offset, block.size):
+                value = block.data[i]
+                if value > maximum:
+                    return
+                yield value
+            pos += 1
+            offset = 0
+
+    def __str__(self) -> str:
+        """Строковое представление коллекции."""
+        return f"[{', '.join(str(v) for v in self)}] (size={self.size}, blocks={len(self.blocks)})"
+
+
 # ===== Статический массив для сравнения =====
 class StaticArrayForComparison:
     """Упрощенный статический массив для сравнения производительности."""
@@ -90,13 +645,19 @@ class StaticArrayForComparison:
 
 
 # ===== Демонстрация работы динамического массива =====
+def print_resize_event(event: dict) -> None:
+    """Обработчик on_resize для демонстрации: выводит событие в консоль."""
+    print(f"  Изменение емкости массива: {event['old_capacity']} → {event['new_capacity']} "
+          f"(скопировано {event['copied']}, {event['elapsed_ns']} нс)")
+
+
 def demonstrate_dynamic_array():
     print("=" * 60)
     print("ДЕМОНСТРАЦИЯ РАБОТЫ ДИНАМИЧЕСКОГО МАССИВА")
     print("=" * 60)
     
     # Создаем динамический массив с маленькой начальной емкостью
-    dyn_arr = DynamicArray(initial_capacity=2)
+    dyn_arr = DynamicArray(initial_capacity=2, on_resize=print_resize_event)
     print(f"Создан динамический массив с начальной емкостью: {dyn_arr.capacity}")
     print()
     
@@ -145,6 +706,8 @@ def compare_performance():
     dyn_stats = dyn_arr.get_stats()
     print(f"  Время: {dyn_time:.4f} секунд")
     print(f"  Расширений: {dyn_stats['expansions']}")
+    print(f"  Скопировано при расширениях: {dyn_stats['copied_total']} элементов "
+          f"за {dyn_stats['resize_time_ns'] / 1e6:.2f} мс")
     print(f"  Финальная емкость: {dyn_stats['capacity']}")
     print(f"  Коэффициент загрузки: {dyn_stats['load_factor']:.2%}")
     print()
@@ -233,11 +796,226 @@ def visualize_expansion():
         print()
 
 
+# ===== Стратегии роста и сжатие =====
+def compare_growth_policies():
+    print("\n" + "=" * 60)
+    print("СТРАТЕГИИ РОСТА И АВТОМАТИЧЕСКОЕ СЖАТИЕ")
+    print("=" * 60)
+
+    n_elements = 1000
+    policies = [
+        ("×2", grow_double),
+        ("×1.5", grow_one_and_half),
+        ("×2 до 256, затем +256", additive_growth(256, 256)),
+    ]
+
+    print("1. Рост до 1000 элементов:")
+    for name, policy in policies:
+        arr = DynamicArray(initial_capacity=4, growth_policy=policy)
+        for i in range(n_elements):
+            arr.append(i)
+        stats = arr.get_stats()
+        print(f"  {name:22}: расширений={stats['expansions']}, "
+              f"емкость={stats['capacity']}, загрузка={stats['load_factor']:.0%}")
+    print()
+
+    print("2. Всплеск и возврат памяти (auto_shrink=True):")
+    arr = DynamicArray(initial_capacity=4, auto_shrink=True)
+    for i in range(n_elements):
+        arr.append(i)
+    while arr.size > 10:
+        arr.pop()
+    stats = arr.get_stats()
+    print(f"  Пиковая емкость: {stats['peak_capacity']}, текущая: {stats['capacity']}, "
+          f"сжатий: {stats['shrinks']}")
+    print()
+
+    print("3. Чередование append/pop на границе емкости:")
+    before = arr.get_stats()
+    for _ in range(1000):
+        arr.append(0)
+        arr.pop()
+    after = arr.get_stats()
+    print(f"  Перевыделений за 1000 циклов: "
+          f"{after['expansions'] + after['shrinks'] - before['expansions'] - before['shrinks']}")
+
+
+# ===== Пакетная загрузка =====
+def compare_bulk_loading():
+    print("\n" + "=" * 60)
+    print("ПАКЕТНАЯ ЗАГРУЗКА (extend / from_iterable)")
+    print("=" * 60)
+
+    n_elements = 1000000
+    source = range(n_elements)
+
+    start_time = time.time()
+    by_append = DynamicArray()
+    for value in source:
+        by_append.append(value)
+    append_time = time.time() - start_time
+
+    start_time = time.time()
+    by_extend = DynamicArray.from_iterable(source)
+    extend_time = time.time() - start_time
+
+    start_time = time.time()
+    builtin = []
+    builtin.extend(source)
+    list_time = time.time() - start_time
+
+    print(f"  append в цикле:  {append_time:.4f} сек, расширений: {by_append.expansions}")
+    print(f"  from_iterable:   {extend_time:.4f} сек, расширений: {by_extend.expansions}")
+    print(f"  list.extend:     {list_time:.4f} сек")
+    print(f"  Срез [10:15]: {list(by_extend[10:15])}, последний: {by_extend[-1]}")
+    print(f"  Сумма через итератор: {sum(by_extend)}")
+
+
+# ===== Типизированный массив и буфер =====
+def demonstrate_typed_buffer():
+    print("\n" + "=" * 60)
+    print("ТИПИЗИРОВАННЫЙ МАССИВ И ПРОТОКОЛ БУФЕРА")
+    print("=" * 60)
+
+    n_elements = 100000
+    plain = DynamicArray.from_iterable(range(1000, 1000 + n_elements))
+    typed = TypedDynamicArray.from_iterable(range(1000, 1000 + n_elements), typecode='q')
+
+    plain_bytes = sys.getsizeof(plain.data) + sum(sys.getsizeof(plain.data[i]) for i in range(plain.size))
+    print(f"  DynamicArray:      ~{plain_bytes / n_elements:.1f} байт на элемент")
+    print(f"  TypedDynamicArray: ~{sys.getsizeof(typed.data) / n_elements:.1f} байт на элемент")
+
+    view = typed.as_memoryview()
+    print(f"  memoryview: формат '{view.format}', {view.nbytes} байт, без копирования")
+    print(f"  struct.unpack_from по смещению 8: {struct.unpack_from('q', view, 8)[0]}")
+
+    path = os.path.join(tempfile.gettempdir(), "typed_dynamic_array.bin")
+    with open(path, "wb") as f:
+        f.write(view)
+    print(f"  Записано в файл напрямую из буфера: {os.path.getsize(path)} байт")
+    os.remove(path)
+    view.release()
+
+
+# ===== Задержка отдельных append =====
+def compare_append_latency():
+    print("\n" + "=" * 60)
+    print("ЗАДЕРЖКА ОТДЕЛЬНЫХ APPEND (ПЕРЦЕНТИЛИ)")
+    print("=" * 60)
+
+    clock = time.perf_counter_ns
+    # Расширение всегда приходится на одни и те же append, а паузы ОС - на случайные,
+    # поэтому для каждой позиции берем минимум по нескольким повторам
+    repeats = 3
+
+    def measure(factory, n_elements):
+        latencies = [0] * n_elements
+        arr = factory()
+        gc.disable()  # Паузы сборщика мусора не относятся к самой структуре
+        try:
+            for i in range(n_elements):
+                start_ns = clock()
+                arr.append(i)
+                latencies[i] = clock() - start_ns
+        finally:
+            gc.enable()
+        return latencies
+
+    for n_elements in [10 ** 4, 10 ** 5, 10 ** 6]:
+        print(f"\n  n = {n_elements}:")
+        for name, factory in [("DynamicArray", DynamicArray), ("SegmentedArray", SegmentedArray)]:
+            runs = [measure(factory, n_elements) for _ in range(repeats)]
+            latencies = sorted(map(min, *runs))
+
+            def percentile(p):
+                return latencies[min(n_elements - 1, int(n_elements * p))]
+
+            print(f"    {name:15}: p50={percentile(0.5)} нс, p99={percentile(0.99)} нс, "
+                  f"p99.9={percentile(0.999)} нс, max={latencies[-1] / 1e6:.3f} мс")
+
+    print("  У DynamicArray максимум растет с n (копирование при расширении),")
+    print("  у SegmentedArray он ограничен выделением одного блока.")
+
+
+# ===== Представления без копирования =====
+def compare_views():
+    print("\n" + "=" * 60)
+    print("СКОЛЬЗЯЩИЕ ОКНА: СРЕЗЫ С КОПИРОВАНИЕМ И ПРЕДСТАВЛЕНИЯ")
+    print("=" * 60)
+
+    n_elements = 100000
+    window = 1000
+    n_windows = 5000
+    arr = DynamicArray.from_iterable(range(n_elements))
+
+    start_time = time.time()
+    copies = [arr[i:i + window] for i in range(n_windows)]
+    copy_time = time.time() - start_time
+
+    start_time = time.time()
+    views = [arr.view(i, i + window) for i in range(n_windows)]
+    view_time = time.time() - start_time
+
+    print(f"  {n_windows} окон по {window} элементов:")
+    print(f"    срезы (копии):  {copy_time:.4f} сек")
+    print(f"    представления: {view_time:.4f} сек")
+    print(f"  Окна совпадают: {all(list(c) == v.tolist() for c, v in zip(copies[:50], views[:50]))}")
+
+    inner = views[10][100:200:10]
+    print(f"  Вложенный срез views[10][100:200:10]: {inner}")
+    inner[0] = -1
+    print(f"  Запись через представление: arr[110] = {arr[110]}")
+
+    arr.reserve(arr.capacity * 2)
+    try:
+        views[0][0]
+    except RuntimeError as e:
+        print(f"  После расширения массива: {e}")
+
+
+# ===== Упорядоченная коллекция из блоков =====
+def compare_sorted_chunks():
+    print("\n" + "=" * 60)
+    print("УПОРЯДОЧЕННАЯ КОЛЛЕКЦИЯ ИЗ БЛОКОВ")
+    print("=" * 60)
+
+    n_elements = 30000
+    random.seed(3)
+    keys = [random.randrange(10 * n_elements) for _ in range(n_elements)]
+
+    start_time = time.time()
+    flat = DynamicArray()
+    for key in keys:
+        flat.insert(bisect.bisect_right(flat.data, key, 0, flat.size), key)
+    flat_time = time.time() - start_time
+
+    start_time = time.time()
+    chunks = SortedChunkList(load=500)
+    for key in keys:
+        chunks.add(key)
+    chunk_time = time.time() - start_time
+
+    print(f"  Один упорядоченный DynamicArray: {flat_time:.4f} сек на {n_elements} вставок")
+    print(f"  SortedChunkList:                 {chunk_time:.4f} сек, блоков: {len(chunks.blocks)}")
+    print(f"  Порядок совпадает: {list(flat) == list(chunks)}")
+    print(f"  Медиана: {chunks[len(chunks) // 2]}, элементов в [1000, 5000]: "
+          f"{len(list(chunks.irange(1000, 5000)))}")
+    for key in keys[:n_elements // 2]:
+        chunks.remove(key)
+    print(f"  После удаления половины: размер {len(chunks)}, блоков: {len(chunks.blocks)}")
+
+
 # Запуск демонстрации
 if __name__ == "__main__":
     demonstrate_dynamic_array()
     compare_performance()
     visualize_expansion()
+    compare_growth_policies()
+    compare_bulk_loading()
+    demonstrate_typed_buffer()
+    compare_append_latency()
+    compare_views()
+    compare_sorted_chunks()
     
     print("=" * 60)
     print("ВЫВОДЫ:")
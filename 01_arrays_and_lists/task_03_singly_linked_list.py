@@ -5,9 +5,17 @@
 - удаление по значению,
 - поиск по значению,
 - разворот списка in-place.
+Дополнительно: хвостовой указатель, склейка, вставка и разрезание списков за O(1).
+Развернутый список (UnrolledLinkedList): массив значений в каждом узле.
+Список с пропусками (SkipList): упорядоченный поиск, ранги и диапазоны за O(log n).
 Сравнить операции вставки/удаления с массивом.
 """
 
+import array
+import heapq
+import random
+from collections import deque
+
 class Node:
     """Узел односвязного списка."""
     def __init__(self, value):
@@ -19,6 +27,7 @@ class SinglyLinkedList:
     
     def __init__(self):
         self.head = None
+        self.tail = None
         self.length = 0
     
     def pushFront(self, value) -> None:
@@ -26,20 +35,25 @@ class SinglyLinkedList:
         new_node = Node(value)
         new_node.next = self.head
         self.head = new_node
+        if self.tail is None:
+            self.tail = new_node
         self.length += 1
     
     def pushBack(self, value) -> None:
-        """Вставка в конец. Сложность: O(n) без tail, O(1) с tail"""
+        """Вставка в конец. Сложность: O(1) благодаря tail"""
         new_node = Node(value)
         if not self.head:
             self.head = new_node
         else:
-            current = self.head
-            while current.next:
-                current = current.next
-            current.next = new_node
+            self.tail.next = new_node
+        self.tail = new_node
         self.length += 1
     
+    def extend(self, iterable) -> None:
+        """Добавление всех значений в конец. Сложность: O(k)"""
+        for value in iterable:
+            self.pushBack(value)
+    
     def removeByValue(self, value) -> bool:
         """Удаление по значению. Сложность: O(n)"""
         if not self.head:
@@ -48,6 +62,8 @@ class SinglyLinkedList:
         # Удаление головы
         if self.head.value == value:
             self.head = self.head.next
+            if self.head is None:
+                self.tail = None
             self.length -= 1
             return True
         
@@ -55,6 +71,8 @@ class SinglyLinkedList:
         current = self.head
         while current.next:
             if current.next.value == value:
+                if current.next is self.tail:
+                    self.tail = current
                 current.next = current.next.next
                 self.length -= 1
                 return True
@@ -75,6 +93,7 @@ class SinglyLinkedList:
         """Разворот списка in-place. Сложность: O(n)"""
         prev = None
         current = self.head
+        self.tail = current
         while current:
             next_node = current.next
             current.next = prev
@@ -82,6 +101,154 @@ class SinglyLinkedList:
             current = next_node
         self.head = prev
     
+    def node_at(self, index: int) -> Node:
+        """Узел по позиции. Сложность: O(index)"""
+        if index < 0 or index >= self.length:
+            raise IndexError(f"Индекс {index} вне диапазона [0, {self.length-1}]")
+        current = self.head
+        for _ in range(index):
+            current = current.next
+        return current
+    
+    def _take_all(self):
+        """Забрать все узлы списка (список становится пустым)."""
+        nodes = (self.head, self.tail, self.length)
+        self.head = None
+        self.tail = None
+        self.length = 0
+        return nodes
+    
+    def concat(self, other: "SinglyLinkedList") -> None:
+        """Присоединение узлов other в конец. Сложность: O(1)
+        
+        Узлы не копируются, а переходят в этот список; other становится пустым.
+        """
+        if other is self:
+            raise ValueError("Нельзя присоединить список к самому себе")
+        head, tail, length = other._take_all()
+        if head is None:
+            return
+        if self.head is None:
+            self.head = head
+        else:
+            self.tail.next = head
+        self.tail = tail
+        self.length += length
+    
+    def splice_after(self, node: Node, other: "SinglyLinkedList") -> None:
+        """Вставка всех узлов other после node (None - в начало). Сложность: O(1)
+        
+        node должен принадлежать этому списку; other становится пустым.
+        """
+        if other is self:
+            raise ValueError("Нельзя вставить список в самого себя")
+        head, tail, length = other._take_all()
+        if head is None:
+            return
+        if node is None:
+            tail.next = self.head
+            self.head = head
+            if self.tail is None:
+                self.tail = tail
+        else:
+            tail.next = node.next
+            node.next = head
+            if node is self.tail:
+                self.tail = tail
+        self.length += length
+    
+    def split_at(self, index: int) -> "SinglyLinkedList":
+        """Разрезание: узлы с позиции index уходят в новый список.
+        
+        Сложность: O(index) на поиск места разреза, узлы не копируются.
+        """
+        if index < 0 or index > self.length:
+            raise IndexError(f"Индекс {index} вне диапазона [0, {self.length}]")
+        rest = type(self)()
+        if index == self.length:
+            return rest
+        if index == 0:
+            rest.head, rest.tail, rest.length = self._take_all()
+            return rest
+        before = self.node_at(index - 1)
+        rest.head = before.next
+        rest.tail = self.tail
+        rest.length = self.length - index
+        before.next = None
+        self.tail = before
+        self.length = index
+        return rest
+    
+    @staticmethod
+    def _cut(node: Node, count: int) -> Node:
+        """Отрезать цепочку после count узлов; вернуть начало остатка."""
+        for _ in range(count - 1):
+            if node is None:
+                return None
+            node = node.next
+        if node is None:
+            return None
+        rest = node.next
+        node.next = None
+        return rest
+    
+    @staticmethod
+    def _merge_chains(prev: Node, left: Node, right: Node) -> Node:
+        """Слияние двух упорядоченных цепочек после узла prev; вернуть последний узел.
+        
+        При равенстве первым идет узел из left, поэтому слияние устойчиво.
+        """
+        while left and right:
+            if right.value < left.value:
+                prev.next = right
+                right = right.next
+            else:
+                prev.next = left
+                left = left.next
+            prev = prev.next
+        prev.next = left if left else right
+        while prev.next:
+            prev = prev.next
+        return prev
+    
+    def sort(self) -> None:
+        """Устойчивая сортировка слиянием снизу вверх, in-place.
+        
+        Узлы не копируются, а перецепляются; рекурсии нет, дополнительная
+        память - один служебный узел. Сложность: O(n log n), память O(1).
+        """
+        if self.length < 2:
+            return
+        dummy = Node(None)
+        dummy.next = self.head
+        width = 1
+        while width < self.length:
+            prev = dummy
+            current = dummy.next
+            while current:
+                left = current
+                right = self._cut(left, width)
+                current = self._cut(right, width)
+                prev = self._merge_chains(prev, left, right)
+            width *= 2
+        self.head = dummy.next
+        self.tail = prev
+    
+    def merge_sorted(self, other: "SinglyLinkedList") -> None:
+        """Слияние с другим упорядоченным списком за O(n + m).
+        
+        Оба списка должны быть отсортированы. Узлы other переходят
+        в этот список (other становится пустым), при равенстве
+        элементы этого списка идут первыми.
+        """
+        if other is self:
+            raise ValueError("Нельзя слить список с самим собой")
+        head, _, length = other._take_all()
+        dummy = Node(None)
+        self.tail = self._merge_chains(dummy, self.head, head) if (self.head or head) else None
+        self.head = dummy.next
+        self.length += length
+    
     def __str__(self) -> str:
         """Представление списка для вывода."""
         elements = []
@@ -92,6 +259,646 @@ class SinglyLinkedList:
         return " -> ".join(elements) if elements else "Пусто"
 
 
+def merge_k_sorted(lists) -> SinglyLinkedList:
+    """Слияние k упорядоченных списков через кучу за O(n log k).
+    
+    Узлы перецепляются в новый список, исходные списки становятся пустыми.
+    При равных значениях раньше идут узлы из списков с меньшим номером.
+    """
+    heap = []
+    total = 0
+    for number, source in enumerate(lists):
+        head, _, length = source._take_all()
+        total += length
+        if head is not None:
+            heap.append((head.value, number, head))
+    heapq.heapify(heap)
+    
+    result = SinglyLinkedList()
+    dummy = Node(None)
+    prev = dummy
+    while heap:
+        _, number, node = heap[0]
+        if node.next is not None:
+            heapq.heapreplace(heap, (node.next.value, number, node.next))
+        else:
+            heapq.heappop(heap)
+        prev.next = node
+        prev = node
+    prev.next = None
+    result.head = dummy.next
+    result.tail = prev if total else None
+    result.length = total
+    return result
+
+
+class IndexedSinglyLinkedList(SinglyLinkedList):
+    """Односвязный список с хэш-индексом для поиска и удаления за O(1).
+
+    Индекс состоит из двух словарей:
+    - значение -> очередь узлов с этим значением в порядке списка;
+    - узел -> предыдущий узел (None для головы).
+    Дубликаты разрешены: find проверяет наличие хотя бы одного,
+    removeByValue удаляет первое вхождение (как в SinglyLinkedList).
+    Значения должны быть хэшируемыми.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.occurrences = {}  # значение -> deque узлов в порядке списка
+        self.prev_of = {}  # узел -> предыдущий узел
+
+    def _rebuild_index(self) -> None:
+        """Полная перестройка индекса. Сложность: O(n)"""
+        self.occurrences = {}
+        self.prev_of = {}
+        self._index_from(None, self.head)
+
+    def _index_from(self, prev: Node, node: Node) -> None:
+        """Добавление в индекс цепочки узлов, начиная с node (в конец очередей)."""
+        while node:
+            self.prev_of[node] = prev
+            self.occurrences.setdefault(node.value, deque()).append(node)
+            prev = node
+            node = node.next
+
+    def _take_all(self):
+        self.occurrences = {}
+        self.prev_of = {}
+        return super()._take_all()
+
+    def pushFront(self, value) -> None:
+        """Вставка в начало. Сложность: O(1)"""
+        old_head = self.head
+        super().pushFront(value)
+        if old_head is not None:
+            self.prev_of[old_head] = self.head
+        self.prev_of[self.head] = None
+        self.occurrences.setdefault(value, deque()).appendleft(self.head)
+
+    def pushBack(self, value) -> None:
+        """Вставка в конец. Сложность: O(1)"""
+        old_tail = self.tail
+        super().pushBack(value)
+        self.prev_of[self.tail] = old_tail
+        self.occurrences.setdefault(value, deque()).append(self.tail)
+
+    def removeByValue(self, value) -> bool:
+        """Удаление первого вхождения. Сложность: O(1) в среднем"""
+        nodes = self.occurrences.get(value)
+        if not nodes:
+            return False
+        node = nodes.popleft()
+        if not nodes:
+            del self.occurrences[value]
+        prev = self.prev_of.pop(node)
+        following = node.next
+        if prev is None:
+            self.head = following
+        else:
+            prev.next = following
+        if following is not None:
+            self.prev_of[following] = prev
+        if node is self.tail:
+            self.tail = prev
+        self.length -= 1
+        return True
+
+    def find(self, value) -> bool:
+        """Поиск по значению. Сложность: O(1) в среднем"""
+        return value in self.occurrences
+
+    def reverse(self) -> None:
+        """Разворот списка и индекса. Сложность: O(n)"""
+        super().reverse()
+        for nodes in self.occurrences.values():
+            nodes.reverse()
+        prev = None
+        node = self.head
+        while node:
+            self.prev_of[node] = prev
+            prev = node
+            node = node.next
+
+    def concat(self, other: SinglyLinkedList) -> None:
+        """Присоединение узлов other. Сложность: O(k) - новые узлы попадают в индекс."""
+        old_tail = self.tail
+        super().concat(other)
+        self._index_from(old_tail, old_tail.next if old_tail else self.head)
+
+    def splice_after(self, node: Node, other: SinglyLinkedList) -> None:
+        """Вставка узлов other после node. Сложность: O(n) - индекс перестраивается."""
+        super().splice_after(node, other)
+        self._rebuild_index()
+
+    def sort(self) -> None:
+        """Сортировка с перестройкой индекса. Сложность: O(n log n)"""
+        super().sort()
+        self._rebuild_index()
+
+    def merge_sorted(self, other: SinglyLinkedList) -> None:
+        """Слияние с перестройкой индекса. Сложность: O(n + m)"""
+        super().merge_sorted(other)
+        self._rebuild_index()
+
+    def split_at(self, index: int) -> "IndexedSinglyLinkedList":
+        """Разрезание списка. Сложность: O(n) - индексы обеих частей перестраиваются."""
+        rest = super().split_at(index)
+        self._rebuild_index()
+        rest._rebuild_index()
+        return rest
+
+
+class SkipNode:
+    """Узел списка с пропусками: несколько ссылок next, по одной на уровень.
+
+    width[i] - сколько узлов нижнего уровня перепрыгивает ссылка next[i]
+    (нужно для поиска по позиции и ранга).
+    """
+    def __init__(self, value, level: int):
+        self.value = value
+        self.next = [None] * level
+        self.width = [1] * level
+
+
+class SkipList:
+    """Упорядоченный список с пропусками (skip list).
+
+    Нижний уровень - обычный односвязный упорядоченный список, верхние
+    уровни - "экспресс-линии" через случайно выбранные узлы. Поиск,
+    вставка и удаление - O(log n) в среднем независимо от порядка вставок.
+    Дубликаты разрешены.
+    """
+
+    def __init__(self, p: float = 0.5, max_level: int = 32, seed=None):
+        """Инициализация списка.
+
+        Args:
+            p: Вероятность того, что узел поднимется на следующий уровень
+            max_level: Максимальное число уровней
+            seed: Зерно генератора уровней (для воспроизводимости)
+        """
+        self.p = p
+        self.max_level = max_level
+        self.head = SkipNode(None, max_level)
+        self.level = 1  # Число используемых уровней
+        self.length = 0
+        self._random = random.Random(seed)
+
+    def _random_level(self) -> int:
+        level = 1
+        while level < self.max_level and self._random.random() < self.p:
+            level += 1
+        return level
+
+    def _search_path(self, value):
+        """Последние узлы со значением < value на каждом уровне и их позиции.
+
+        Позиция головы - 0, узлов - с 1. Сложность: O(log n) в среднем.
+        """
+        update = [self.head] * self.max_level
+        rank = [0] * self.max_level
+        node = self.head
+        position = 0
+        for i in range(self.level - 1, -1, -1):
+            while node.next[i] is not None and node.next[i].value < value:
+                position += node.width[i]
+                node = node.next[i]
+            update[i] = node
+            rank[i] = position
+        return update, rank
+
+    def add(self, value) -> None:
+        """Вставка с сохранением порядка. Сложность: O(log n) в среднем"""
+        update, rank = self._search_path(value)
+        level = self._random_level()
+        if level > self.level:
+            for i in range(self.level, level):
+                update[i] = self.head
+                rank[i] = 0
+                self.head.width[i] = self.length + 1  # Ссылка "в конец" списка
+            self.level = level
+
+        node = SkipNode(value, level)
+        for i in range(level):
+            prev = update[i]
+            node.next[i] = prev.next[i]
+            prev.next[i] = node
+            node.width[i] = prev.width[i] - (rank[0] - rank[i])
+            prev.width[i] = rank[0] - rank[i] + 1
+        for i in range(level, self.level):
+            update[i].width[i] += 1
+        self.length += 1
+
+    def remove(self, value) -> bool:
+        """Удаление одного вхождения. Сложность: O(log n) в среднем"""
+        update, _ = self._search_path(value)
+        node = update[0].next[0]
+        if node is None or node.value != value:
+            return False
+        for i in range(self.level):
+            prev = update[i]
+            if prev.next[i] is node:
+                prev.width[i] += node.width[i] - 1
+                prev.next[i] = node.next[i]
+            else:
+                prev.width[i] -= 1
+        while self.level > 1 and self.head.next[self.level - 1] is None:
+            self.level -= 1
+        self.length -= 1
+        return True
+
+    def find(self, value) -> bool:
+        """Поиск по значению. Сложность: O(log n) в среднем"""
+        update, _ = self._search_path(value)
+        node = update[0].next[0]
+        return node is not None and node.value == value
+
+    def __contains__(self, value) -> bool:
+        return self.find(value)
+
+    def rank(self, value) -> int:
+        """Количество элементов меньше value. Сложность: O(log n) в среднем"""
+        _, rank = self._search_path(value)
+        return rank[0]
+
+    def __getitem__(self, index: int):
+        """Элемент по позиции в порядке возрастания. Сложность: O(log n) в среднем"""
+        if index < 0:
+            index += self.length
+        if index < 0 or index >= self.length:
+            raise IndexError(f"Индекс {index} вне диапазона [0, {self.length-1}]")
+        target = index + 1
+        node = self.head
+        position = 0
+        for i in range(self.level - 1, -1, -1):
+            while node.next[i] is not None and position + node.width[i] <= target:
+                position += node.width[i]
+                node = node.next[i]
+        return node.value
+
+    def irange(self, minimum, maximum):
+        """Элементы minimum <= x <= maximum по возрастанию.
+
+        Сложность: O(log n) на поиск начала + O(k) на выдачу.
+        """
+        update, _ = self._search_path(minimum)
+        node = update[0].next[0]
+        while node is not None and not maximum < node.value:
+            yield node.value
+            node = node.next[0]
+
+    def __iter__(self):
+        node = self.head.next[0]
+        while node is not None:
+            yield node.value
+            node = node.next[0]
+
+    def __len__(self) -> int:
+        return self.length
+
+    def __str__(self) -> str:
+        """Представление списка для вывода."""
+        elements = [str(value) for value in self]
+        return " -> ".join(elements) if elements else "Пусто"
+
+
+def _load_binary_search_tree():
+    """Загрузка BinarySearchTree из задания 11 для сравнения."""
+    import importlib.util
+    import os
+    path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..",
+                        "04_trees_and_graphs", "task_11_binary_search_tree.py")
+    spec = importlib.util.spec_from_file_location("task_11_binary_search_tree", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module.BinarySearchTree
+
+
+class ArenaLinkedList:
+    """Односвязный список в "арене": узлы - это индексы в параллельных столбцах.
+
+    values[i] хранит значение узла i, next[i] - индекс следующего узла
+    (-1 - конец списка). Отдельных объектов Node нет, поэтому память
+    на узел - несколько байт вместо объекта с __dict__. Освобожденные
+    ячейки связываются в список свободных и используются повторно.
+    """
+
+    NIL = -1
+
+    def __init__(self, typecode: str = None):
+        """Инициализация списка.
+
+        Args:
+            typecode: Код типа array для значений ('q', 'd', ...);
+                None - значения хранятся в обычном списке Python
+        """
+        self.typecode = typecode
+        self.values = array.array(typecode) if typecode else []
+        self.next = array.array('q')
+        self._empty = 0 if typecode else None
+        self.head = self.NIL
+        self.tail = self.NIL
+        self.free = self.NIL  # Голова списка свободных ячеек
+        self.length = 0
+
+    def _alloc(self, value) -> int:
+        """Выделение ячейки (сначала из списка свободных). Сложность: O(1)"""
+        if self.free != self.NIL:
+            slot = self.free
+            self.free = self.next[slot]
+            self.values[slot] = value
+            self.next[slot] = self.NIL
+        else:
+            slot = len(self.next)
+            self.values.append(value)
+            self.next.append(self.NIL)
+        return slot
+
+    def _release(self, slot: int) -> None:
+        """Возврат ячейки в список свободных. Сложность: O(1)"""
+        self.values[slot] = self._empty
+        self.next[slot] = self.free
+        self.free = slot
+
+    def pushFront(self, value) -> None:
+        """Вставка в начало. Сложность: O(1)"""
+        slot = self._alloc(value)
+        self.next[slot] = self.head
+        self.head = slot
+        if self.tail == self.NIL:
+            self.tail = slot
+        self.length += 1
+
+    def pushBack(self, value) -> None:
+        """Вставка в конец. Сложность: O(1)"""
+        slot = self._alloc(value)
+        if self.head == self.NIL:
+            self.head = slot
+        else:
+            self.next[self.tail] = slot
+        self.tail = slot
+        self.length += 1
+
+    def removeByValue(self, value) -> bool:
+        """Удаление первого вхождения по значению. Сложность: O(n)"""
+        values, next_ = self.values, self.next
+        prev = self.NIL
+        current = self.head
+        while current != self.NIL:
+            if values[current] == value:
+                if prev == self.NIL:
+                    self.head = next_[current]
+                else:
+                    next_[prev] = next_[current]
+                if current == self.tail:
+                    self.tail = prev
+                self._release(current)
+                self.length -= 1
+                return True
+            prev = current
+            current = next_[current]
+        return False
+
+    def find(self, value) -> bool:
+        """Поиск по значению. Сложность: O(n)
+
+        Свободные ячейки всегда хранят пустое значение, поэтому любое
+        другое значение в столбце values принадлежит живому узлу, и
+        столбец можно просмотреть целиком без переходов по ссылкам.
+        """
+        if value is not self._empty and value != self._empty:
+            return value in self.values
+        values, next_ = self.values, self.next
+        current = self.head
+        while current != self.NIL:
+            if values[current] == value:
+                return True
+            current = next_[current]
+        return False
+
+    def reverse(self) -> None:
+        """Разворот списка in-place. Сложность: O(n)"""
+        next_ = self.next
+        prev = self.NIL
+        current = self.head
+        self.tail = current
+        while current != self.NIL:
+            following = next_[current]
+            next_[current] = prev
+            prev = current
+            current = following
+        self.head = prev
+
+    def __iter__(self):
+        values, next_ = self.values, self.next
+        current = self.head
+        while current != self.NIL:
+            yield values[current]
+            current = next_[current]
+
+    def __len__(self) -> int:
+        return self.length
+
+    def __str__(self) -> str:
+        """Представление списка для вывода."""
+        elements = [str(value) for value in self]
+        return " -> ".join(elements) if elements else "Пусто"
+
+
+class UnrolledNode:
+    """Узел развернутого списка: небольшой массив значений вместо одного."""
+    def __init__(self, values=None):
+        self.values = values if values is not None else []
+        self.next = None
+
+
+class UnrolledLinkedList:
+    """Развернутый (unrolled) односвязный список.
+
+    Каждый узел хранит до capacity значений, поэтому на каждые capacity
+    элементов приходится один объект узла и один переход по ссылке.
+    Переполненный узел делится пополам, узел, заполненный меньше чем
+    наполовину, занимает значения у соседа или сливается с ним.
+    """
+
+    def __init__(self, capacity: int = 64):
+        """Инициализация списка.
+
+        Args:
+            capacity: Максимальное число значений в узле (>= 2)
+        """
+        if capacity < 2:
+            raise ValueError("Емкость узла должна быть не меньше 2")
+        self.capacity = capacity
+        self.min_fill = capacity // 2
+        self.head = None
+        self.tail = None
+        self.length = 0
+
+    def _locate(self, index: int):
+        """Узел, содержащий позицию index, его предшественник и смещение.
+
+        Сложность: O(n / capacity)
+        """
+        prev = None
+        node = self.head
+        while index >= len(node.values):
+            index -= len(node.values)
+            prev = node
+            node = node.next
+        return prev, node, index
+
+    def _split(self, node: UnrolledNode) -> UnrolledNode:
+        """Деление полного узла пополам. Сложность: O(capacity)"""
+        half = len(node.values) // 2
+        new_node = UnrolledNode(node.values[half:])
+        del node.values[half:]
+        new_node.next = node.next
+        node.next = new_node
+        if node is self.tail:
+            self.tail = new_node
+        return new_node
+
+    def _rebalance(self, prev: UnrolledNode, node: UnrolledNode) -> None:
+        """Восстановление заполненности узла после удаления. Сложность: O(capacity)"""
+        if len(node.values) >= self.min_fill:
+            return
+        following = node.next
+        if following is not None:
+            if len(node.values) + len(following.values) <= self.capacity:
+                # Сливаем соседа в текущий узел
+                node.values.extend(following.values)
+                node.next = following.next
+                if following is self.tail:
+                    self.tail = node
+            else:
+                # Занимаем у соседа столько, чтобы узлы сравнялись
+                count = (len(following.values) - len(node.values)) // 2
+                node.values.extend(following.values[:count])
+                del following.values[:count]
+        elif prev is not None and len(prev.values) + len(node.values) <= self.capacity:
+            # Хвостовой узел вливаем в предыдущий
+            prev.values.extend(node.values)
+            prev.next = None
+            self.tail = prev
+        elif not node.values:
+            # Опустел единственный узел
+            self.head = self.tail = None
+
+    def insert(self, index: int, value) -> None:
+        """Вставка по позиции. Сложность: O(n / capacity + capacity)"""
+        if index < 0 or index > self.length:
+            raise IndexError(f"Индекс {index} вне диапазона [0, {self.length}]")
+        if self.head is None:
+            self.head = self.tail = UnrolledNode()
+        if index == self.length:
+            node, offset = self.tail, len(self.tail.values)
+        else:
+            _, node, offset = self._locate(index)
+        if len(node.values) == self.capacity:
+            new_node = self._split(node)
+            if offset > len(node.values):
+                offset -= len(node.values)
+                node = new_node
+        node.values.insert(offset, value)
+        self.length += 1
+
+    def pushFront(self, value) -> None:
+        """Вставка в начало. Сложность: O(capacity)"""
+        self.insert(0, value)
+
+    def pushBack(self, value) -> None:
+        """Вставка в конец. Сложность: O(1) амортизированно"""
+        self.insert(self.length, value)
+
+    def pop(self, index: int = None):
+        """Удаление и возврат элемента по позиции (по умолчанию - последнего).
+
+        Сложность: O(n / capacity + capacity)
+        """
+        if index is None:
+            index = self.length - 1
+        if index < 0:
+            index += self.length
+        if index < 0 or index >= self.length:
+            raise IndexError(f"Индекс {index} вне диапазона [0, {self.length-1}]")
+        prev, node, offset = self._locate(index)
+        value = node.values.pop(offset)
+        self.length -= 1
+        self._rebalance(prev, node)
+        return value
+
+    def removeByValue(self, value) -> bool:
+        """Удаление первого вхождения по значению. Сложность: O(n)"""
+        prev = None
+        node = self.head
+        while node is not None:
+            if value in node.values:
+                node.values.remove(value)
+                self.length -= 1
+                self._rebalance(prev, node)
+                return True
+            prev = node
+            node = node.next
+        return False
+
+    def find(self, value) -> bool:
+        """Поиск по значению. Сложность: O(n), но с шагом в целый узел"""
+        node = self.head
+        while node is not None:
+            if value in node.values:
+                return True
+            node = node.next
+        return False
+
+    def __getitem__(self, index: int):
+        """Доступ по позиции. Сложность: O(n / capacity)"""
+        if index < 0:
+            index += self.length
+        if index < 0 or index >= self.length:
+            raise IndexError(f"Индекс {index} вне диапазона [0, {self.length-1}]")
+        _, node, offset = self._locate(index)
+        return node.values[offset]
+
+    def __setitem__(self, index: int, value) -> None:
+        """Изменение по позиции. Сложность: O(n / capacity)"""
+        if index < 0:
+            index += self.length
+        if index < 0 or index >= self.length:
+            raise IndexError(f"Индекс {index} вне диапазона [0, {self.length-1}]")
+        _, node, offset = self._locate(index)
+        node.values[offset] = value
+
+    def __iter__(self):
+        node = self.head
+        while node is not None:
+            yield from node.values
+            node = node.next
+
+    def __len__(self) -> int:
+        return self.length
+
+    def get_stats(self) -> dict:
+        """Статистика заполненности узлов."""
+        nodes = 0
+        node = self.head
+        while node is not None:
+            nodes += 1
+            node = node.next
+        return {
+            'length': self.length,
+            'nodes': nodes,
+            'capacity': self.capacity,
+            'fill': self.length / (nodes * self.capacity) if nodes else 0.0
+        }
+
+    def __str__(self) -> str:
+        """Представление списка для вывода."""
+        elements = [str(value) for value in self]
+        return " -> ".join(elements) if elements else "Пусто"
+
+
 # Демонстрация работы
 if __name__ == "__main__":
     print("=== Демонстрация односвязного списка ===\n")
@@ -121,6 +928,18 @@ if __name__ == "__main__":
     sll.reverse()
     print(f"   После разворота: {sll}")
     
+    print("\n5. Склейка и разрезание списков:")
+    other = SinglyLinkedList()
+    other.extend([10, 20, 30])
+    sll.concat(other)
+    print(f"   После concat([10, 20, 30]): {sll}, второй список: {other}")
+    middle = SinglyLinkedList()
+    middle.extend([7, 8])
+    sll.splice_after(sll.node_at(1), middle)
+    print(f"   После splice_after(узел 1, [7, 8]): {sll}")
+    tail_part = sll.split_at(3)
+    print(f"   split_at(3): {sll} | {tail_part}")
+    
     print("\n=== Сравнение со списком Python (массивом) ===\n")
     
     import time
@@ -145,5 +964,179 @@ if __name__ == "__main__":
     print(f"  Массив (Python list): {array_time:.4f} сек (O(n) на операцию)")
     print(f"  Ускорение: {array_time/list_time:.1f}x в пользу списка")
     
+    # Склейка множества частичных списков
+    print("\nСклейка 1000 списков по 100 элементов:")
+    parts = []
+    for p in range(1000):
+        part = SinglyLinkedList()
+        part.extend(range(p * 100, (p + 1) * 100))
+        parts.append(part)
+    
+    start = time.time()
+    copied = SinglyLinkedList()
+    for part in parts:
+        current = part.head
+        while current:
+            copied.pushBack(current.value)
+            current = current.next
+    copy_time = time.time() - start
+    
+    start = time.time()
+    joined = SinglyLinkedList()
+    for part in parts:
+        joined.concat(part)
+    concat_time = time.time() - start
+    print(f"  Копирование узлов: {copy_time:.4f} сек")
+    print(f"  concat:            {concat_time:.6f} сек, длина {joined.length}")
+    
+    # Список с хэш-индексом против обычного
+    print("\nПоиск и удаление по значению в списке из 10^5 элементов:")
+    n_nodes = 10 ** 5
+    targets = list(range(0, n_nodes, 500))
+    for name, factory in [("SinglyLinkedList", SinglyLinkedList),
+                          ("IndexedSinglyLinkedList", IndexedSinglyLinkedList)]:
+        test_list = factory()
+        test_list.extend(range(n_nodes))
+        
+        start = time.time()
+        found = sum(test_list.find(t) for t in targets)
+        removed = sum(test_list.removeByValue(t) for t in targets)
+        elapsed = time.time() - start
+        print(f"  {name:24}: {elapsed:.4f} сек на {len(targets)} find + {len(targets)} removeByValue "
+              f"(найдено {found}, удалено {removed})")
+    
+    # Сортировка in-place против копирования в массив
+    import tracemalloc
+    
+    print("\nСортировка 10^5 узлов:")
+    random.seed(6)
+    source = [random.randrange(10 ** 6) for _ in range(10 ** 5)]
+    
+    copy_sorted = SinglyLinkedList()
+    copy_sorted.extend(source)
+    tracemalloc.start()
+    start = time.time()
+    values = []
+    current = copy_sorted.head
+    while current:
+        values.append(current.value)
+        current = current.next
+    values.sort()
+    rebuilt = SinglyLinkedList()
+    rebuilt.extend(values)
+    copy_time = time.time() - start
+    copy_peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    
+    in_place = SinglyLinkedList()
+    in_place.extend(source)
+    tracemalloc.start()
+    start = time.time()
+    in_place.sort()
+    sort_time = time.time() - start
+    sort_peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    print(f"  Через список Python: {copy_time:.4f} сек, доп. память {copy_peak / 2**20:.1f} МБ")
+    print(f"  sort() in-place:     {sort_time:.4f} сек, доп. память {sort_peak / 1024:.1f} КБ")
+    print(f"  Результаты совпадают: {str(rebuilt) == str(in_place)}")
+    
+    parts = []
+    for p in range(3):
+        part = SinglyLinkedList()
+        part.extend(sorted(random.randrange(20) for _ in range(4)))
+        parts.append(part)
+    print(f"  k-way слияние {[str(p) for p in parts]}:")
+    print(f"    {merge_k_sorted(parts)}")
+    
+    # Список с пропусками на отсортированных вставках
+    import sys
+    
+    print("\nОтсортированные вставки 3000 ключей и поиск каждого:")
+    BinarySearchTree = _load_binary_search_tree()
+    n_keys = 3000
+    old_limit = sys.getrecursionlimit()
+    sys.setrecursionlimit(n_keys + 1000)  # BST вырождается в цепочку глубины n
+    
+    structures = [("SinglyLinkedList", SinglyLinkedList(), "pushBack", "find"),
+                  ("BinarySearchTree", BinarySearchTree(), "insert", "search"),
+                  ("SkipList", SkipList(seed=7), "add", "find")]
+    for name, structure, insert_name, search_name in structures:
+        insert = getattr(structure, insert_name)
+        search = getattr(structure, search_name)
+        start = time.time()
+        for key in range(n_keys):
+            insert(key)
+        insert_time = time.time() - start
+        start = time.time()
+        found = sum(1 for key in range(n_keys) if search(key))
+        search_time = time.time() - start
+        print(f"  {name:17}: вставка {insert_time:.4f} сек, поиск {search_time:.4f} сек (найдено {found})")
+    sys.setrecursionlimit(old_limit)
+    
+    skip = structures[2][1]
+    print(f"  SkipList: rank(1500) = {skip.rank(1500)}, [2999] = {skip[2999]}, "
+          f"irange(10, 15) = {list(skip.irange(10, 15))}")
+    
+    # Список в арене против списка из объектов Node
+    print("\nСписок из 10^6 целых: объекты Node против арены:")
+    n_nodes = 10 ** 6
+    n_memory = 10 ** 4  # Память замеряем на меньшем n: tracemalloc сильно замедляет выделения
+    for name, factory in [("SinglyLinkedList", SinglyLinkedList),
+                          ("ArenaLinkedList", ArenaLinkedList),
+                          ("ArenaLinkedList('q')", lambda: ArenaLinkedList('q'))]:
+        tracemalloc.start()
+        test_list = factory()
+        for i in range(n_memory):
+            test_list.pushBack(i + 1000)
+        memory = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        
+        test_list = factory()
+        for i in range(n_nodes):
+            test_list.pushBack(i + 1000)
+        start = time.time()
+        test_list.find(-1)
+        scan_time = time.time() - start
+        print(f"  {name:22}: ~{memory / n_memory:.0f} байт на узел, полный проход find: {scan_time:.4f} сек")
+        del test_list
+    
+    # Развернутый список против списка из объектов Node
+    print("\nСписок из 10^6 целых: узел на значение против развернутого списка:")
+    for name, factory in [("SinglyLinkedList", SinglyLinkedList),
+                          ("UnrolledLinkedList(64)", UnrolledLinkedList)]:
+        tracemalloc.start()
+        test_list = factory()
+        for i in range(n_memory):
+            test_list.pushBack(i + 1000)
+        memory = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        
+        test_list = factory()
+        for i in range(n_nodes):
+            test_list.pushBack(i + 1000)
+        start = time.time()
+        if isinstance(test_list, UnrolledLinkedList):
+            total = sum(test_list)
+        else:
+            total = 0
+            current = test_list.head
+            while current:
+                total += current.value
+                current = current.next
+        walk_time = time.time() - start
+        start = time.time()
+        test_list.find(-1)
+        scan_time = time.time() - start
+        print(f"  {name:22}: ~{memory / n_memory:.0f} байт на элемент, "
+              f"обход: {walk_time:.4f} сек, find: {scan_time:.4f} сек")
+        del test_list
+    
+    unrolled = UnrolledLinkedList(capacity=4)
+    for i in range(10):
+        unrolled.pushBack(i)
+    unrolled.insert(5, 99)
+    unrolled.pop(0)
+    print(f"  UnrolledLinkedList(4) после вставки/удаления: {unrolled}, {unrolled.get_stats()}")
+    
     print("\nВывод: Односвязный список эффективнее для частых вставок в начало,")
     print("       но уступает массиву в произвольном доступе (O(n) vs O(1)).")
\ No newline at end of file
@@ -4,8 +4,16 @@
 - вставку после произвольного узла,
 - удаление узла без поиска "сначала".
 Реализовать итератор по двусвязному списку.
+Дополнительно: операции дека, перенос диапазонов узлов между списками за O(1),
+LRU-кэш на двусвязном списке и хэш-таблице.
 """
 
+import functools
+import heapq
+import itertools
+import time
+
+
 class DoublyNode:
     """Узел двусвязного списка."""
     def __init__(self, value):
@@ -19,6 +27,7 @@ class DoublyLinkedList:
     def __init__(self):
         self.head = None
         self.tail = None
+        self.length = 0
     
     def insert_after(self, node: DoublyNode, value) -> DoublyNode:
         """Вставка после произвольного узла. Сложность: O(1)"""
@@ -40,6 +49,7 @@ class DoublyLinkedList:
         if node == self.tail:
             self.tail = new_node
         
+        self.length += 1
         return new_node
     
     def delete_node(self, node: DoublyNode) -> None:
@@ -58,6 +68,133 @@ class DoublyLinkedList:
             self.head = node.next
         if node == self.tail:
             self.tail = node.prev
+        
+        node.prev = None
+        node.next = None
+        self.length -= 1
+    
+    # Операции над диапазонами узлов
+    @staticmethod
+    def _count(first: DoublyNode, last: DoublyNode) -> int:
+        """Число узлов от first до last включительно. Сложность: O(k)"""
+        count = 1
+        while first is not last:
+            first = first.next
+            if first is None:
+                raise ValueError("Узел last не достижим из first")
+            count += 1
+        return count
+    
+    @staticmethod
+    def _range_contains(first: DoublyNode, last: DoublyNode, node: DoublyNode) -> bool:
+        """Лежит ли node в диапазоне first..last. Сложность: O(k)"""
+        current = first
+        while current is not node:
+            if current is last:
+                return False
+            current = current.next
+            if current is None:
+                raise ValueError("Узел last не достижим из first")
+        return True
+    
+    def detach(self, first: DoublyNode, last: DoublyNode = None,
+               count: int = None) -> tuple:
+        """Отсоединение диапазона узлов first..last в отдельную цепочку.
+
+        Сложность: O(1), если передан count - длина диапазона;
+        иначе O(k) на ее подсчет.
+        """
+        if last is None:
+            last = first
+            count = 1
+        elif count is None:
+            count = self._count(first, last)
+        
+        before, after = first.prev, last.next
+        if before:
+            before.next = after
+        else:
+            self.head = after
+        if after:
+            after.prev = before
+        else:
+            self.tail = before
+        
+        first.prev = None
+        last.next = None
+        self.length -= count
+        return first, last
+    
+    def attach(self, after_node: DoublyNode, first: DoublyNode,
+               last: DoublyNode = None, count: int = None) -> None:
+        """Вставка отсоединенной цепочки first..last после after_node.
+
+        after_node=None - вставка в начало. Сложность: O(1), если передан
+        count; иначе O(k) на подсчет длины.
+        """
+        if last is None:
+            last = first
+            count = 1
+        elif count is None:
+            count = self._count(first, last)
+        
+        following = after_node.next if after_node else self.head
+        first.prev = after_node
+        last.next = following
+        if after_node:
+            after_node.next = first
+        else:
+            self.head = first
+        if following:
+            following.prev = last
+        else:
+            self.tail = last
+        self.length += count
+    
+    def splice(self, after_node: DoublyNode, first: DoublyNode,
+               last: DoublyNode = None, source: "DoublyLinkedList" = None,
+               count: int = None) -> None:
+        """Перенос диапазона first..last (из source или этого же списка) после after_node.
+
+        Внутри одного списка after_node не должен лежать внутри диапазона,
+        иначе получится цикл. Если передан count, это проверяется проходом
+        по диапазону (O(k), ValueError при нарушении). Без count перенос
+        стоит O(1), а проверка выполняется только в assert (отключается
+        при запуске python -O). Между списками - O(1), если передан count,
+        иначе O(k) на подсчет длины.
+        """
+        if last is None:
+            last = first
+        if source is None or source is self:
+            if after_node is first or after_node is last:
+                raise ValueError("after_node не может лежать внутри переносимого диапазона")
+            if count is not None:
+                if after_node is not None and self._range_contains(first, last, after_node):
+                    raise ValueError("after_node не может лежать внутри переносимого диапазона")
+            else:
+                assert after_node is None or not self._range_contains(first, last, after_node), \
+                    "after_node не может лежать внутри переносимого диапазона"
+            if after_node is first.prev:
+                return
+            self.detach(first, last, count=0)
+            self.attach(after_node, first, last, count=0)
+            return
+        if count is None:
+            count = self._count(first, last)
+        source.detach(first, last, count)
+        self.attach(after_node, first, last, count)
+    
+    def move_to_front(self, node: DoublyNode) -> None:
+        """Перенос узла в начало списка. Сложность: O(1)"""
+        if node is not self.head:
+            self.detach(node)
+            self.attach(None, node)
+    
+    def move_to_end(self, node: DoublyNode) -> None:
+        """Перенос узла в конец списка. Сложность: O(1)"""
+        if node is not self.tail:
+            self.detach(node)
+            self.attach(self.tail, node)
     
     # Вспомогательные методы для демонстрации
     def append(self, value) -> DoublyNode:
@@ -70,8 +207,79 @@ class DoublyLinkedList:
             self.tail.next = new_node
             new_node.prev = self.tail
             self.tail = new_node
+        self.length += 1
+        return new_node
+    
+    # Операции дека
+    def appendleft(self, value) -> DoublyNode:
+        """Добавление в начало. Сложность: O(1)"""
+        new_node = DoublyNode(value)
+        self.attach(None, new_node)
         return new_node
     
+    def pop(self):
+        """Удаление и возврат последнего элемента. Сложность: O(1)"""
+        if self.tail is None:
+            raise IndexError("pop из пустого списка")
+        node = self.tail
+        self.delete_node(node)
+        return node.value
+    
+    def popleft(self):
+        """Удаление и возврат первого элемента. Сложность: O(1)"""
+        if self.head is None:
+            raise IndexError("pop из пустого списка")
+        node = self.head
+        self.delete_node(node)
+        return node.value
+    
+    def extend(self, iterable) -> None:
+        """Добавление элементов в конец. Сложность: O(k)"""
+        for value in iterable:
+            self.append(value)
+    
+    def extendleft(self, iterable) -> None:
+        """Добавление элементов в начало (в обратном порядке, как у deque). Сложность: O(k)"""
+        for value in iterable:
+            self.appendleft(value)
+    
+    def rotate(self, steps: int = 1) -> None:
+        """Циклический сдвиг вправо на steps (влево при steps < 0).
+
+        Сложность: O(min(k, n - k)) на поиск точки разреза, перестановка - O(1).
+        """
+        if self.length < 2:
+            return
+        steps %= self.length
+        if steps == 0:
+            return
+        # Новый хвост - узел на позиции n - steps - 1
+        if steps <= self.length // 2:
+            new_tail = self.tail
+            for _ in range(steps):
+                new_tail = new_tail.prev
+        else:
+            new_tail = self.head
+            for _ in range(self.length - steps - 1):
+                new_tail = new_tail.next
+        new_head = new_tail.next
+        
+        self.tail.next = self.head
+        self.head.prev = self.tail
+        new_head.prev = None
+        new_tail.next = None
+        self.head = new_head
+        self.tail = new_tail
+    
+    def clear(self) -> None:
+        """Очистка списка. Сложность: O(1)"""
+        self.head = None
+        self.tail = None
+        self.length = 0
+    
+    def __len__(self) -> int:
+        return self.length
+    
     def __str__(self) -> str:
         """Строковое представление списка."""
         elements = []
@@ -109,6 +317,208 @@ class DoublyLinkedList:
     def reverse_iterator(self):
         """Итерация в обратном порядке."""
         return self.DoublyLinkedListIterator(self.tail, reverse=True)
+    
+    __reversed__ = reverse_iterator
+
+
+_MISSING = object()
+
+
+class LRUCache:
+    """LRU-кэш: хэш-таблица ключ -> узел и двусвязный список порядка доступа.
+
+    Голова списка - давно не использованный элемент, хвост - последний
+    использованный. Узел хранит кортеж (key, value, weight, expires_at).
+    get/put/peek/pop - O(1): поиск узла через словарь, перестановка и
+    удаление - через DoublyLinkedList без обхода. Записи со сроком жизни
+    дополнительно лежат в куче по expires_at, чтобы при переполнении
+    сначала выбрасывать просроченные, а не самые старые живые.
+    """
+
+    def __init__(self, capacity: int = 128, weigher=None, ttl: float = None,
+                 clock=time.monotonic):
+        """Инициализация кэша.
+
+        Args:
+            capacity: Максимальный суммарный вес записей
+            weigher: Функция value -> вес; None - каждая запись весит 1
+                (емкость в штуках)
+            ttl: Время жизни записи в секундах по умолчанию; None - без срока
+            clock: Источник времени (для тестов можно подменить)
+        """
+        if capacity <= 0:
+            raise ValueError("Емкость должна быть положительной")
+        self.capacity = capacity
+        self.weigher = weigher
+        self.ttl = ttl
+        self.clock = clock
+        self.nodes = {}
+        self.order = DoublyLinkedList()
+        self.weight = 0
+        self._expiry = []  # Куча (expires_at, номер, узел); удаленные узлы чистятся лениво
+        self._sequence = itertools.count()
+        
+        # Счетчики
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def _unlink(self, node: DoublyNode) -> None:
+        """Удаление записи из списка и словаря. Сложность: O(1)"""
+        self.order.delete_node(node)
+        del self.nodes[node.value[0]]
+        self.weight -= node.value[2]
+
+    def _lookup(self, key) -> DoublyNode:
+        """Поиск живой записи; просроченная удаляется. Сложность: O(1)"""
+        node = self.nodes.get(key)
+        if node is None:
+            return None
+        expires_at = node.value[3]
+        if expires_at is not None and self.clock() >= expires_at:
+            self._unlink(node)
+            self.expirations += 1
+            return None
+        return node
+
+    def _drop_expired(self) -> int:
+        """Удаление просроченных записей по куче сроков. Сложность: O(k log n)"""
+        now = self.clock()
+        expiry = self._expiry
+        dropped = 0
+        while expiry and expiry[0][0] <= now:
+            _, _, node = heapq.heappop(expiry)
+            if self.nodes.get(node.value[0]) is node:
+                self._unlink(node)
+                dropped += 1
+        self.expirations += dropped
+        return dropped
+
+    def _compact_expiry(self) -> None:
+        """Перестройка кучи сроков без узлов, уже удаленных из кэша. Сложность: O(n)"""
+        self._expiry = [entry for entry in self._expiry
+                        if self.nodes.get(entry[2].value[0]) is entry[2]]
+        heapq.heapify(self._expiry)
+
+    def _touch(self, node: DoublyNode) -> None:
+        """Перенос записи в конец (самая свежая). Сложность: O(1)"""
+        self.order.move_to_end(node)
+
+    def get(self, key, default=None):
+        """Значение по ключу с отметкой об использовании. Сложность: O(1)"""
+        node = self._lookup(key)
+        if node is None:
+            self.misses += 1
+            return default
+        self.hits += 1
+        self._touch(node)
+        return node.value[1]
+
+    def peek(self, key, default=None):
+        """Значение по ключу без изменения порядка и счетчиков. Сложность: O(1)"""
+        node = self._lookup(key)
+        return default if node is None else node.value[1]
+
+    def put(self, key, value, ttl: float = None) -> None:
+        """Добавление или замена записи с вытеснением старых. Сложность: O(1)*
+
+        * Амортизированно: каждое вытеснение оплачено своей вставкой;
+        для записей со сроком жизни - O(log n) на кучу сроков.
+        При переполнении сначала удаляются просроченные записи,
+        и только потом - давно не использованные живые.
+        """
+        weight = self.weigher(value) if self.weigher else 1
+        if weight > self.capacity:
+            raise ValueError(f"Вес записи {weight} больше емкости кэша {self.capacity}")
+        if ttl is None:
+            ttl = self.ttl
+        expires_at = self.clock() + ttl if ttl is not None else None
+        
+        node = self.nodes.get(key)
+        if node is not None:
+            self._unlink(node)
+        node = self.order.append((key, value, weight, expires_at))
+        self.nodes[key] = node
+        self.weight += weight
+        if expires_at is not None:
+            heapq.heappush(self._expiry, (expires_at, next(self._sequence), node))
+            if len(self._expiry) > 2 * len(self.nodes) + 16:
+                self._compact_expiry()
+        
+        if self.weight > self.capacity:
+            self._drop_expired()
+        while self.weight > self.capacity:
+            self._unlink(self.order.head)
+            self.evictions += 1
+
+    def pop(self, key, default=_MISSING):
+        """Удаление записи с возвратом значения. Сложность: O(1)"""
+        node = self._lookup(key)
+        if node is None:
+            if default is _MISSING:
+                raise KeyError(key)
+            return default
+        self._unlink(node)
+        return node.value[1]
+
+    def purge_expired(self) -> int:
+        """Удаление всех просроченных записей. Сложность: O(k log n)"""
+        return self._drop_expired()
+
+    def clear(self) -> None:
+        """Очистка кэша (счетчики сохраняются)."""
+        self.nodes.clear()
+        self.order.clear()
+        self._expiry = []
+        self.weight = 0
+
+    def __contains__(self, key) -> bool:
+        return self._lookup(key) is not None
+
+    def __len__(self) -> int:
+        return len(self.nodes)
+
+    def get_stats(self) -> dict:
+        """Статистика работы кэша."""
+        requests = self.hits + self.misses
+        return {
+            'size': len(self.nodes),
+            'weight': self.weight,
+            'capacity': self.capacity,
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'expirations': self.expirations,
+            'hit_rate': self.hits / requests if requests else 0.0
+        }
+
+
+def memoize(capacity: int = 128, weigher=None, ttl: float = None):
+    """Декоратор кэширования результатов функции в LRUCache.
+
+    Ключ - позиционные аргументы и отсортированные именованные.
+    Результаты тяжелее всего кэша не кэшируются. Сам кэш доступен
+    как атрибут cache обернутой функции.
+    """
+    def decorator(func):
+        cache = LRUCache(capacity, weigher=weigher, ttl=ttl)
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            key = args + (_MISSING,) + tuple(sorted(kwargs.items())) if kwargs else args
+            value = cache.get(key, _MISSING)
+            if value is _MISSING:
+                value = func(*args, **kwargs)
+                try:
+                    cache.put(key, value)
+                except ValueError:
+                    pass
+            return value
+
+        wrapper.cache = cache
+        return wrapper
+    return decorator
 
 
 # Демонстрация работы
@@ -161,5 +571,71 @@ if __name__ == "__main__":
     print("     - Итерация: только вперед")
     print("     - Память: 1 указатель на узел (next)")
     
+    print("\n8. Операции дека и перенос диапазонов:")
+    tasks = DoublyLinkedList()
+    tasks.extend(range(1, 6))
+    tasks.appendleft(0)
+    tasks.rotate(2)
+    print(f"   extend + appendleft + rotate(2): {tasks}, длина {len(tasks)}")
+    print(f"   pop() = {tasks.pop()}, popleft() = {tasks.popleft()}: {tasks}")
+    
+    other = DoublyLinkedList()
+    a = other.append("a")
+    other.append("b")
+    c = other.append("c")
+    tasks.splice(tasks.head, a, c, source=other, count=3)
+    print(f"   splice a..c после головы: {tasks}; источник: {other}, длины {len(tasks)} и {len(other)}")
+    tasks.move_to_front(c)
+    tasks.move_to_end(a)
+    print(f"   move_to_front(c), move_to_end(a): {tasks}")
+    
+    print("   Перенос серии из 10^5 узлов в другой список:")
+    source = DoublyLinkedList()
+    source.extend(range(10 ** 5))
+    target = DoublyLinkedList()
+    start = time.time()
+    while len(source):
+        target.append(source.popleft())
+    print(f"     по одному узлу: {time.time() - start:.4f} сек")
+    start = time.time()
+    source.splice(None, target.head, target.tail, source=target, count=len(target))
+    print(f"     splice с известной длиной: {time.time() - start:.6f} сек")
+    
+    print("\n9. LRU-кэш на двусвязном списке:")
+    cache = LRUCache(capacity=3)
+    for key in "abc":
+        cache.put(key, key.upper())
+    cache.get("a")       # "a" становится самым свежим
+    cache.put("d", "D")  # вытесняется "b"
+    print(f"   Ключи от старых к новым: {[entry[0] for entry in cache.order]}")
+    print(f"   get('b') = {cache.get('b')}, peek('c') = {cache.peek('c')}, pop('a') = {cache.pop('a')}")
+    
+    weighted = LRUCache(capacity=10, weigher=len)
+    for word in ["abc", "defg", "hi", "jklmn"]:
+        weighted.put(word, word)
+    print(f"   По весу (емкость 10, вес = длина): {[entry[0] for entry in weighted.order]}, вес {weighted.weight}")
+    
+    now = [0.0]
+    timed = LRUCache(capacity=10, ttl=5, clock=lambda: now[0])
+    timed.put("session", 42)
+    timed.put("token", 7, ttl=60)
+    now[0] = 10.0
+    print(f"   Через 10 сек: session = {timed.get('session')}, token = {timed.get('token')}")
+    
+    @memoize(capacity=100)
+    def fib(n):
+        return n if n < 2 else fib(n - 1) + fib(n - 2)
+    print(f"   fib(80) = {fib(80)}, {fib.cache.get_stats()}")
+    
+    print("   Время get на разных размерах кэша (O(1)):")
+    for size in [10 ** 3, 10 ** 5]:
+        big = LRUCache(capacity=size)
+        for i in range(size):
+            big.put(i, i)
+        start = time.time()
+        for i in range(10 ** 5):
+            big.get(i % size)
+        print(f"     {size:>6} записей: {time.time() - start:.4f} сек на 10^5 обращений")
+    
     print("\nВывод: Двусвязный список эффективнее для удаления,")
     print("       но требует больше памяти для хранения указателей.")
\ No newline at end of file
@@ -2,8 +2,12 @@
 Задание 5: Стек
 Реализация стека на массиве и связном списке.
 Использование стека для проверки корректности скобочной последовательности.
+Дополнительно: стек на цепочке блоков-массивов, персистентный стек.
 """
 
+import time
+import tracemalloc
+
 # Класс для узла связного списка
 class Node:
     def __init__(self, value):
@@ -79,6 +83,139 @@ class LinkedListStack:
         return result
 
 
+# Блок фиксированного размера для BlockStack
+class Block:
+    def __init__(self, size):
+        self.values = [None] * size
+        self.prev = None
+
+
+# Стек на цепочке блоков: один объект на block_size элементов, а не на каждый.
+# Опустевший блок остается запасным, поэтому push/pop на границе блока
+# не выделяют память заново.
+class BlockStack:
+    def __init__(self, block_size=256):
+        if block_size < 1:
+            raise ValueError("Размер блока должен быть положительным")
+        self.block_size = block_size
+        self.top = None          # Верхний блок
+        self.count = block_size  # Занято ячеек в верхнем блоке
+        self.spare = None        # Запасной пустой блок
+        self._size = 0
+        self.blocks_allocated = 0
+    
+    def push(self, value):
+        if self.count == self.block_size:
+            block = self.spare
+            if block is None:
+                block = Block(self.block_size)
+                self.blocks_allocated += 1
+            else:
+                self.spare = None
+            block.prev = self.top
+            self.top = block
+            self.count = 0
+        self.top.values[self.count] = value
+        self.count += 1
+        self._size += 1
+    
+    def pop(self):
+        if self.is_empty():
+            return None
+        self.count -= 1
+        values = self.top.values
+        value = values[self.count]
+        values[self.count] = None  # Не держим ссылку на снятый объект
+        self._size -= 1
+        if self.count == 0:
+            block = self.top
+            self.top = block.prev
+            block.prev = None
+            self.spare = block
+            self.count = self.block_size
+        return value
+    
+    def peek(self):
+        if self.is_empty():
+            return None
+        return self.top.values[self.count - 1]
+    
+    def is_empty(self):
+        return self._size == 0
+    
+    def size(self):
+        return self._size
+    
+    # Обход от вершины ко дну без копирования
+    def __iter__(self):
+        block = self.top
+        if block is None:
+            return
+        values = block.values
+        for i in range(self.count - 1, -1, -1):
+            yield values[i]
+        block = block.prev
+        while block is not None:
+            yield from reversed(block.values)
+            block = block.prev
+    
+    def __len__(self):
+        return self._size
+    
+    def show(self):
+        return list(self)
+
+
+# Персистентный стек: версии неизменяемы и делят общие "хвосты" из узлов Node.
+# push/pop возвращают новую версию за O(1), старые версии остаются рабочими,
+# поэтому ветвление (fork) не копирует стек.
+class PersistentStack:
+    def __init__(self, top=None, size=0):
+        self._top = top
+        self._size = size
+    
+    def push(self, value):
+        new_node = Node(value)
+        new_node.next = self._top
+        return PersistentStack(new_node, self._size + 1)
+    
+    def pop(self):
+        if self.is_empty():
+            raise IndexError("pop из пустого стека")
+        return PersistentStack(self._top.next, self._size - 1)
+    
+    def peek(self):
+        if self.is_empty():
+            return None
+        return self._top.value
+    
+    def is_empty(self):
+        return self._top is None
+    
+    def size(self):
+        return self._size
+    
+    # Новая ветка от текущей версии: узлы общие, копирования нет
+    def fork(self):
+        return PersistentStack(self._top, self._size)
+    
+    # Сохраненная версия; изменить ее нельзя, поэтому копирование не нужно
+    def snapshot(self):
+        return PersistentStack(self._top, self._size)
+    
+    def __iter__(self):
+        current = self._top
+        while current:
+            yield current.value
+            current = current.next
+    
+    def __len__(self):
+        return self._size
+    
+    def show(self):
+        return list(self)
+
+
 # Проверка скобочных последовательностей
 def check_brackets(expression):
     stack = ArrayStack()
@@ -185,5 +322,110 @@ if __name__ == "__main__":
     print(f"\nВ конце стек пустой? {stack.is_empty()}")
     print(f"Результат: {'Все скобки закрыты' if stack.is_empty() else 'Ошибка в скобках'}")
     
+    print("\n\n5. Стек на блоках:")
+    print("-" * 20)
+    
+    block_stack = BlockStack(block_size=4)
+    for i in range(1, 10):
+        block_stack.push(i)
+    print(f"Стек после 9 push (блоки по 4): {block_stack.show()}")
+    print(f"Вершина: {block_stack.peek()}, размер: {block_stack.size()}")
+    
+    block_stack.pop()
+    for _ in range(1000):
+        block_stack.push(0)
+        block_stack.pop()
+    print(f"1000 push/pop на границе блока: выделено блоков {block_stack.blocks_allocated}")
+    
+    print("\n10^6 push, затем 10^6 pop:")
+    n = 10 ** 6
+    for name, factory in [("ArrayStack", ArrayStack),
+                          ("LinkedListStack", LinkedListStack),
+                          ("BlockStack", BlockStack)]:
+        stack = factory()
+        start = time.time()
+        for i in range(n):
+            stack.push(i)
+        push_time = time.time() - start
+        start = time.time()
+        for i in range(n):
+            stack.pop()
+        pop_time = time.time() - start
+        
+        # Память замеряем отдельно и на меньшем n: tracemalloc сильно замедляет выделения
+        n_memory = 10 ** 4
+        stack = factory()
+        tracemalloc.start()
+        for i in range(n_memory):
+            stack.push(None)
+        memory = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        print(f"  {name:16}: push {push_time:.3f} сек, pop {pop_time:.3f} сек, "
+              f"~{memory / n_memory:.1f} байт на элемент без учета самих значений")
+    
+    print("\n\n6. Персистентный стек:")
+    print("-" * 25)
+    
+    empty = PersistentStack()
+    v1 = empty.push(1)
+    v2 = v1.push(2)
+    v3 = v2.pop().push(3)
+    print(f"v1 = {v1.show()}, v2 = {v2.show()}, v3 = v2.pop().push(3) = {v3.show()}")
+    print(f"v2 и v3 делят узел с 1: {v2.pop()._top is v3.pop()._top}")
+    
+    # Перебор с возвратом: все правильные скобочные последовательности длины 6
+    def generate(prefix, opened, remaining, results):
+        if remaining == 0:
+            if opened.is_empty():
+                results.append(prefix)
+            return
+        for char, closing in [('(', ')'), ('[', ']')]:
+            generate(prefix + char, opened.push(closing), remaining - 1, results)
+        if not opened.is_empty() and len(opened) <= remaining:
+            generate(prefix + opened.peek(), opened.pop(), remaining - 1, results)
+    
+    results = []
+    generate("", PersistentStack(), 6, results)
+    print(f"Скобочных последовательностей длины 6: {len(results)}, например {results[:3]}")
+    print(f"Все корректны: {all(check_brackets(expr) for expr in results)}")
+    
+    print("\n1000 веток от стека из 2000 элементов, по 10 push в каждой:")
+    base_size, branches, pushes = 2000, 1000, 10
+    
+    def build_branches(persistent):
+        live = []
+        if persistent:
+            base = PersistentStack()
+            for i in range(base_size):
+                base = base.push(i)
+            for _ in range(branches):
+                branch = base.fork()
+                for i in range(pushes):
+                    branch = branch.push(i)
+                live.append(branch)
+        else:
+            base = ArrayStack()
+            for i in range(base_size):
+                base.push(i)
+            for _ in range(branches):
+                branch = ArrayStack()
+                branch.data = base.show()
+                for i in range(pushes):
+                    branch.push(i)
+                live.append(branch)
+        return live
+    
+    for name, persistent in [("ArrayStack + show()", False), ("PersistentStack.fork()", True)]:
+        start = time.time()
+        build_branches(persistent)
+        elapsed = time.time() - start
+        
+        tracemalloc.start()
+        live = build_branches(persistent)
+        memory = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        del live
+        print(f"  {name:24}: {elapsed:.4f} сек, ~{memory / 1024:.0f} КБ на все ветки")
+    
     print("\n" + "=" * 40)
     print("Демонстрация завершена!")
\ No newline at end of file